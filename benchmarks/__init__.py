@@ -0,0 +1 @@
+"""Benchmarks for pysmithchart in the airspeed velocity (asv) format."""
@@ -0,0 +1,41 @@
+"""Benchmarks for drawing circles with `SmithAxes.circle`."""
+
+import io
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402 pylint: disable=wrong-import-position
+
+import pysmithchart  # noqa: E402,F401 pylint: disable=wrong-import-position,unused-import
+from pysmithchart import circles  # noqa: E402 pylint: disable=wrong-import-position
+
+
+class TimeCircles:
+    """Compute and draw many clipped circles in the Γ plane."""
+
+    params = [100, 5000]
+    param_names = ["circles"]
+
+    def setup(self, n):
+        """Create random circles, most of them crossing the unit circle."""
+        rng = np.random.default_rng(0)
+        self.center = rng.normal(0, 0.8, n) + 1j * rng.normal(0, 0.8, n)
+        self.radius = rng.uniform(0.05, 1.5, n)
+
+    def teardown(self, n):  # pylint: disable=unused-argument
+        """Close all figures."""
+        plt.close("all")
+
+    def time_paths(self, n):  # pylint: disable=unused-argument
+        """Compute the clipped arcs."""
+        circles.circle_paths(self.center, self.radius)
+
+    def time_draw(self, n):  # pylint: disable=unused-argument
+        """Draw the circles on a Smith chart."""
+        fig = plt.figure(figsize=(6, 6))
+        ax = fig.add_subplot(1, 1, 1, projection="smith")
+        ax.circle(self.center, self.radius, linewidth=0.5)
+        fig.savefig(io.BytesIO(), format="png")
@@ -0,0 +1,42 @@
+"""Benchmarks for N-port parameter conversion with `pysmithchart.conversions`."""
+
+import numpy as np
+
+from pysmithchart import conversions
+
+# Largest parameter array (in bytes) a benchmark may allocate; 100k frequencies of a
+# 32-port would need 1.6 GB per array.
+MAX_BYTES = 256 * 2**20
+
+
+class TimeConversions:
+    """Convert and renormalize random N-port S-parameters over a frequency sweep."""
+
+    params = ([2, 4, 8, 16, 32], [1000, 100000])
+    param_names = ["ports", "frequencies"]
+
+    def setup(self, ports, frequencies):
+        """Create the S-parameters and the complex per-port reference impedances."""
+        if frequencies * ports**2 * 16 > MAX_BYTES:
+            raise NotImplementedError("parameter array too large")
+        rng = np.random.default_rng(0)
+        shape = (frequencies, ports, ports)
+        self.s = 0.2 * (rng.normal(size=shape) + 1j * rng.normal(size=shape))
+        self.z0 = rng.uniform(25, 100, ports) + 1j * rng.uniform(-10, 10, ports)
+        self.z = conversions.s2z(self.s)
+
+    def time_s2z(self, ports, frequencies):  # pylint: disable=unused-argument
+        """Convert S- to Z-parameters."""
+        conversions.s2z(self.s)
+
+    def time_z2s(self, ports, frequencies):  # pylint: disable=unused-argument
+        """Convert Z- to S-parameters with complex reference impedances."""
+        conversions.z2s(self.z, self.z0)
+
+    def time_renormalize(self, ports, frequencies):  # pylint: disable=unused-argument
+        """Renormalize to complex per-port reference impedances."""
+        conversions.renormalize(self.s, self.z0)
+
+    def peakmem_renormalize(self, ports, frequencies):  # pylint: disable=unused-argument
+        """Peak memory of the renormalization."""
+        conversions.renormalize(self.s, self.z0)
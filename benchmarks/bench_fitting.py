@@ -0,0 +1,46 @@
+"""Benchmarks for rational fitting with `pysmithchart.fitting`."""
+
+import numpy as np
+
+from pysmithchart import fitting, network
+
+
+def _responses(freq, traces):
+    """Return input reflection coefficients of `traces` matching networks, shape (traces, F)."""
+    inductance = np.linspace(1e-9, 10e-9, traces)
+    return np.array(
+        [
+            (
+                network.series_inductor(freq, value)
+                @ network.shunt_capacitor(freq, 2e-12)
+                @ network.transmission_line(freq, 0.03, z0=75)
+            ).s11()
+            for value in inductance
+        ]
+    )
+
+
+class TimeVectorFit:
+    """Fit sparse sweeps of many traces and evaluate them densely."""
+
+    params = ([1, 100, 1000], [4, 8, 16])
+    param_names = ["traces", "poles"]
+
+    def setup(self, traces, poles):
+        """Create the sparse samples and a fit to them."""
+        self.freq = np.linspace(0.5e9, 3e9, 101)
+        self.dense = np.linspace(0.5e9, 3e9, 10001)
+        self.data = _responses(self.freq, traces)
+        self.fit = fitting.vector_fit(self.freq, self.data, n_poles=poles)
+
+    def time_fit(self, traces, poles):  # pylint: disable=unused-argument
+        """Fit the samples."""
+        fitting.vector_fit(self.freq, self.data, n_poles=poles)
+
+    def time_evaluate(self, traces, poles):  # pylint: disable=unused-argument
+        """Evaluate the fit at 10001 frequencies."""
+        self.fit(self.dense)
+
+    def track_rms_error(self, traces, poles):  # pylint: disable=unused-argument
+        """Worst RMS error of the fit over the traces."""
+        return float(self.fit.rms_error(self.freq, self.data).max())
@@ -0,0 +1,72 @@
+"""Benchmarks for the locators and the grid construction of `SmithAxes`."""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402 pylint: disable=wrong-import-position
+
+import pysmithchart  # noqa: E402,F401 pylint: disable=wrong-import-position,unused-import
+from pysmithchart.geometry import GEOMETRY_CACHE  # noqa: E402 pylint: disable=wrong-import-position
+from pysmithchart.locators import (  # noqa: E402 pylint: disable=wrong-import-position
+    ImagMaxNLocator,
+    RealMaxNLocator,
+    SmithAutoMinorLocator,
+)
+
+# scParams of every grid configuration
+GRIDS = {
+    "major": {"grid_major_fancy": False},
+    "major-fancy": {"grid_major_fancy": True},
+    "minor": {"grid_major_fancy": False, "grid_minor_enable": True, "grid_minor_fancy": False},
+    "minor-fancy": {"grid_major_fancy": True, "grid_minor_enable": True, "grid_minor_fancy": True},
+}
+
+
+class TimeLocators:
+    """Construct and evaluate the tick locators without the geometry cache."""
+
+    params = [10, 40]
+    param_names = ["maxn"]
+
+    def setup(self, n):  # pylint: disable=unused-argument
+        """Create the axes."""
+        self.fig = plt.figure()
+        self.ax = self.fig.add_subplot(1, 1, 1, projection="smith", grid_share=False)
+
+    def teardown(self, n):  # pylint: disable=unused-argument
+        """Close the figure."""
+        plt.close(self.fig)
+
+    def time_real(self, n):
+        """Compute the real ticks."""
+        RealMaxNLocator(self.ax, n)()
+
+    def time_imag(self, n):
+        """Compute the imaginary ticks."""
+        ImagMaxNLocator(self.ax, n)()
+
+    def time_minor(self, n):  # pylint: disable=unused-argument
+        """Construct the minor locator."""
+        SmithAutoMinorLocator(4)
+
+
+class TimeGrid:
+    """Build the major and minor grids of a Smith chart."""
+
+    params = (list(GRIDS), [False, True])
+    param_names = ["grid", "share"]
+
+    def setup(self, grid, share):  # pylint: disable=unused-argument
+        """Reset the geometry cache."""
+        GEOMETRY_CACHE.clear()
+
+    def teardown(self, grid, share):  # pylint: disable=unused-argument
+        """Close all figures."""
+        plt.close("all")
+
+    def time_grid(self, grid, share):
+        """Create a chart, which builds its grid."""
+        fig = plt.figure()
+        fig.add_subplot(1, 1, 1, projection="smith", grid_share=share, **GRIDS[grid])
+        plt.close(fig)
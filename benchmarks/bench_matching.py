@@ -0,0 +1,29 @@
+"""Benchmarks for matching network synthesis with `pysmithchart.matching`."""
+
+import numpy as np
+
+from pysmithchart import matching
+
+
+class TimeMatching:
+    """Synthesize all branches of a matching network for every frequency of a sweep."""
+
+    params = [1000, 100000]
+    param_names = ["frequencies"]
+
+    def setup(self, n):
+        """Create a load that circles the chart over the sweep."""
+        phase = np.linspace(0, 8 * np.pi, n)
+        self.load = 50 * (1 + 0.6 * np.exp(1j * phase)) / (1 - 0.6 * np.exp(1j * phase))
+
+    def time_l_network(self, n):  # pylint: disable=unused-argument
+        """L-section branches."""
+        matching.l_network(self.load)
+
+    def time_single_stub(self, n):  # pylint: disable=unused-argument
+        """Single-stub branches."""
+        matching.single_stub(self.load)
+
+    def time_double_stub(self, n):  # pylint: disable=unused-argument
+        """Double-stub branches."""
+        matching.double_stub(self.load)
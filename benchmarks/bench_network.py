@@ -0,0 +1,56 @@
+"""Benchmarks for two-port cascades with `pysmithchart.network`."""
+
+import numpy as np
+
+from pysmithchart import network
+
+
+class TimeCascade:
+    """Cascade a matching network of lines, stubs and lumped elements over a frequency sweep."""
+
+    params = [1000, 100000]
+    param_names = ["frequencies"]
+
+    def setup(self, n):
+        """Create the frequency sweep and the blocks."""
+        self.freq = np.linspace(1e9, 3e9, n)
+        self.blocks = self.build(n)
+
+    def build(self, n):  # pylint: disable=unused-argument
+        """Create the two-ports of the matching network."""
+        f = self.freq
+        return [
+            network.series_resistor(f, 1.5),
+            network.transmission_line(f, 0.02, z0=75, velocity_factor=0.66, loss=0.1),
+            network.shunt_stub(f, 0.012, termination="short"),
+            network.series_inductor(f, 2e-9),
+            network.shunt_capacitor(f, 1e-12),
+            network.transformer(f, 1.4),
+        ]
+
+    def time_build(self, n):
+        """Build the blocks."""
+        self.build(n)
+
+    def time_cascade(self, n):  # pylint: disable=unused-argument
+        """Cascade the blocks."""
+        network.cascade(*self.blocks)
+
+    def time_s11(self, n):  # pylint: disable=unused-argument
+        """Cascade the blocks and compute the input reflection coefficient."""
+        network.cascade(*self.blocks).s11(load=100 - 50j)
+
+
+class TimeLineTransform:
+    """Transform a load along a line over a frequency sweep, as for an interactive length slider."""
+
+    params = [1000, 10000]
+    param_names = ["frequencies"]
+
+    def setup(self, n):
+        """Create the frequency sweep."""
+        self.freq = np.linspace(1e9, 3e9, n)
+
+    def time_line_transform(self, n):  # pylint: disable=unused-argument
+        """Transform a load through a lossy line."""
+        network.line_transform(100 - 50j, 75, length=0.1, freq=self.freq, velocity_factor=0.66, loss=0.2)
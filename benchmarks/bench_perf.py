@@ -0,0 +1,44 @@
+"""Benchmarks for the overhead of the instrumentation in `pysmithchart.perf`."""
+
+import io
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402 pylint: disable=wrong-import-position
+
+from pysmithchart import perf  # noqa: E402 pylint: disable=wrong-import-position
+
+
+class TimeInstrumentation:
+    """Render a chart with the instrumentation disabled and enabled."""
+
+    params = [False, True]
+    param_names = ["enabled"]
+
+    def setup(self, enabled):
+        """Create the data and switch the instrumentation."""
+        self.z = np.linspace(10, 200, 1000) + 30j
+        self.previous = perf.is_enabled()
+        perf.enable(enabled)
+
+    def teardown(self, enabled):  # pylint: disable=unused-argument
+        """Restore the instrumentation state and drop the records."""
+        perf.enable(self.previous)
+        perf.reset()
+        plt.close("all")
+
+    def time_savefig(self, enabled):  # pylint: disable=unused-argument
+        """Build, plot and render a chart."""
+        fig = plt.figure(figsize=(6, 6))
+        ax = fig.add_subplot(1, 1, 1, projection="smith", grid_minor_enable=True)
+        ax.plot(self.z, datatype="Z")
+        fig.savefig(io.BytesIO(), format="png")
+        plt.close(fig)
+
+    def time_disabled_timer(self, enabled):  # pylint: disable=unused-argument
+        """Enter and leave a timer block."""
+        with perf.timer("noop"):
+            pass
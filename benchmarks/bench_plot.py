@@ -0,0 +1,40 @@
+"""Benchmarks for `SmithAxes.plot` with each datatype and interpolation mode."""
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402 pylint: disable=wrong-import-position
+
+import pysmithchart  # noqa: E402,F401 pylint: disable=wrong-import-position,unused-import
+
+# keyword arguments of every interpolation mode
+MODES = {
+    "none": {},
+    "interpolate": {"interpolate": 5},
+    "equipoints": {"equipoints": 200},
+}
+
+
+class TimePlot:
+    """Plot a sweep of impedances, reflection coefficients or admittances."""
+
+    params = (["S", "Z", "Y"], list(MODES), [100, 10000])
+    param_names = ["datatype", "mode", "points"]
+
+    def setup(self, datatype, mode, n):  # pylint: disable=unused-argument
+        """Create the axes and the data in the requested datatype."""
+        rng = np.random.default_rng(0)
+        z = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, n))) * np.exp(1j * np.linspace(-1, 1, n))
+        self.data = {"Z": z, "S": (z - 50) / (z + 50), "Y": 1 / z}[datatype]
+        self.fig = plt.figure()
+        self.ax = self.fig.add_subplot(1, 1, 1, projection="smith")
+
+    def teardown(self, datatype, mode, n):  # pylint: disable=unused-argument
+        """Close the figure."""
+        plt.close(self.fig)
+
+    def time_plot(self, datatype, mode, n):  # pylint: disable=unused-argument
+        """Plot the data."""
+        self.ax.plot(self.data, datatype=datatype, **MODES[mode])
@@ -0,0 +1,45 @@
+"""End-to-end benchmarks for rendering Smith charts with `savefig`."""
+
+import io
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402 pylint: disable=wrong-import-position
+
+import pysmithchart  # noqa: E402,F401 pylint: disable=wrong-import-position,unused-import
+
+
+class TimeSavefig:
+    """Create, plot and save a complete chart."""
+
+    params = (["png", "svg", "pdf"], [False, True])
+    param_names = ["format", "minor"]
+
+    def setup(self, fmt, minor):  # pylint: disable=unused-argument
+        """Create the data."""
+        self.z = 50 + 50j * np.tan(np.linspace(-1.4, 1.4, 1000)) + np.linspace(0, 100, 1000)
+
+    def teardown(self, fmt, minor):  # pylint: disable=unused-argument
+        """Close all figures."""
+        plt.close("all")
+
+    def time_savefig(self, fmt, minor):
+        """Build the chart, plot a trace and save it."""
+        fig = plt.figure(figsize=(6, 6))
+        ax = fig.add_subplot(1, 1, 1, projection="smith", grid_minor_enable=minor)
+        ax.plot(self.z, datatype="Z", markevery=100)
+        fig.savefig(io.BytesIO(), format=fmt)
+        plt.close(fig)
+
+    def track_size(self, fmt, minor):
+        """Size of the saved file in bytes."""
+        fig = plt.figure(figsize=(6, 6))
+        ax = fig.add_subplot(1, 1, 1, projection="smith", grid_minor_enable=minor)
+        ax.plot(self.z, datatype="Z", markevery=100)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt)
+        plt.close(fig)
+        return len(buffer.getvalue())
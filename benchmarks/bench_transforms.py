@@ -0,0 +1,63 @@
+"""Benchmarks for the Möbius mappings in `pysmithchart.utils` and `pysmithchart.moebius_transform`."""
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402 pylint: disable=wrong-import-position
+
+import pysmithchart  # noqa: E402,F401 pylint: disable=wrong-import-position,unused-import
+from pysmithchart import utils  # noqa: E402 pylint: disable=wrong-import-position
+
+POINTS = [100, 10000, 1000000, 10000000]
+
+
+class TimeMoebiusZ:
+    """Map impedances to reflection coefficients and back."""
+
+    params = POINTS
+    param_names = ["points"]
+
+    def setup(self, n):
+        """Create random impedances and reflection coefficients."""
+        rng = np.random.default_rng(0)
+        self.z = rng.uniform(0, 200, n) + 1j * rng.normal(0, 100, n)
+        self.gamma = utils.moebius_z(self.z, norm=50)
+
+    def time_moebius_z(self, n):  # pylint: disable=unused-argument
+        """Map impedances to the Γ plane."""
+        utils.moebius_z(self.z, norm=50)
+
+    def time_moebius_inv_z(self, n):  # pylint: disable=unused-argument
+        """Map reflection coefficients back to impedances."""
+        utils.moebius_inv_z(self.gamma, norm=50)
+
+
+class TimeMoebiusTransform:
+    """Transform (x, y) points with the transforms of a Smith chart."""
+
+    params = POINTS
+    param_names = ["points"]
+
+    def setup(self, n):
+        """Create the axes and random points in impedance and Möbius space."""
+        rng = np.random.default_rng(0)
+        self.fig = plt.figure()
+        ax = self.fig.add_subplot(1, 1, 1, projection="smith")
+        self.transform = ax.transMoebius
+        self.inverted = ax.transMoebius.inverted()
+        self.points = np.column_stack([rng.uniform(0, 200, n), rng.normal(0, 100, n)])
+        self.moebius = self.transform.transform_non_affine(self.points)
+
+    def teardown(self, n):  # pylint: disable=unused-argument
+        """Close the figure."""
+        plt.close(self.fig)
+
+    def time_transform(self, n):  # pylint: disable=unused-argument
+        """Apply the Möbius transform."""
+        self.transform.transform_non_affine(self.points)
+
+    def time_inverted(self, n):  # pylint: disable=unused-argument
+        """Apply the inverted Möbius transform."""
+        self.inverted.transform_non_affine(self.moebius)
@@ -0,0 +1,246 @@
+"""
+Offline runner for the pysmithchart benchmarks.
+
+The benchmarks follow the airspeed velocity (asv) conventions, so `asv run` works
+with `asv.conf.json`. This runner needs no asv installation, environment builds or
+network access: it imports the benchmarks from the working tree, runs them in the
+current interpreter and stores the results as JSON, which can then be compared
+between commits.
+
+Example:
+    $ python -m benchmarks.run run -o before.json
+    $ git checkout my-branch
+    $ python -m benchmarks.run run -o after.json
+    $ python -m benchmarks.run compare before.json after.json
+
+Benchmark methods are recognized by their prefix:
+
+    - `time_`: Wall-clock time per call in seconds (median of the repeats).
+    - `peakmem_`: Peak memory allocated during one call in bytes, measured with
+      `tracemalloc` (asv measures the peak resident set size instead).
+    - `track_`: The value returned by the method.
+
+A `setup` that raises `NotImplementedError` skips the parameter combination.
+"""
+
+import argparse
+import datetime
+import importlib
+import itertools
+import json
+import pathlib
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+
+#: Units of the results, by method prefix.
+UNITS = {"time_": "seconds", "peakmem_": "bytes", "track_": "unit"}
+
+
+def _modules():
+    """Import all benchmark modules of this package."""
+    directory = pathlib.Path(__file__).parent
+    return [
+        importlib.import_module(f"{__package__}.{path.stem}") for path in sorted(directory.glob("bench_*.py"))
+    ]
+
+
+def _parameters(cls):
+    """Return all parameter combinations of a benchmark class, following the asv rules."""
+    params = getattr(cls, "params", None)
+    if params is None:
+        return [()]
+    if not (isinstance(params, (list, tuple)) and params and isinstance(params[0], (list, tuple))):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def _benchmarks(pattern=None):
+    """
+    Yield the benchmarks whose name matches `pattern`.
+
+    Yields:
+        tuple: `(name, cls, method, params)` for every benchmark method and parameter combination.
+    """
+    regex = re.compile(pattern) if pattern else None
+    for module in _modules():
+        for cls_name, cls in sorted(vars(module).items()):
+            if not (isinstance(cls, type) and cls.__module__ == module.__name__):
+                continue
+            for method in sorted(vars(cls)):
+                if not method.startswith(tuple(UNITS)):
+                    continue
+                name = f"{module.__name__.rsplit('.', 1)[-1]}.{cls_name}.{method}"
+                if regex and not regex.search(name):
+                    continue
+                for params in _parameters(cls):
+                    yield name, cls, method, params
+
+
+def _measure(func, prefix, repeat, quick):
+    """Run one benchmark function and return its result record."""
+    if prefix == "track_":
+        return {"value": func()}
+    if prefix == "peakmem_":
+        tracemalloc.start()
+        try:
+            func()
+            return {"value": tracemalloc.get_traced_memory()[1]}
+        finally:
+            tracemalloc.stop()
+    timer = timeit.Timer(func)
+    if quick:
+        number, repeat = 1, 1
+    else:
+        func()  # warm up caches and lazy imports
+        number = timer.autorange()[0]
+    samples = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {"value": statistics.median(samples), "min": min(samples), "number": number, "repeat": repeat}
+
+
+def run(pattern=None, repeat=5, quick=False, verbose=True):
+    """
+    Run the benchmarks.
+
+    Args:
+        pattern (str, optional): Regular expression selecting benchmarks by name,
+            e.g. `'bench_grid'` or `'time_plot'`. Defaults to all benchmarks.
+        repeat (int, optional): Number of timing samples per benchmark. Defaults to 5.
+        quick (bool, optional): Call every benchmark only once. Defaults to `False`.
+        verbose (bool, optional): Print every result. Defaults to `True`.
+
+    Returns:
+        dict: `{"meta": ..., "results": {name: record}}` with one record per benchmark and
+        parameter combination, keyed as `'module.Class.method(param, ...)'`.
+    """
+    results = {}
+    for name, cls, method, params in _benchmarks(pattern):
+        key = f"{name}({', '.join(map(str, params))})"
+        prefix = next(p for p in UNITS if method.startswith(p))
+        bench = cls()
+        try:
+            if hasattr(bench, "setup"):
+                bench.setup(*params)
+        except NotImplementedError:
+            results[key] = {"unit": UNITS[prefix], "value": None, "skipped": True}
+            continue
+        try:
+            record = _measure(lambda b=bench, m=method, p=params: getattr(b, m)(*p), prefix, repeat, quick)
+        finally:
+            if hasattr(bench, "teardown"):
+                bench.teardown(*params)
+        results[key] = {"unit": UNITS[prefix], **record}
+        if verbose:
+            print(f"{key:<80} {_format(results[key])}", flush=True)
+    return {"meta": _metadata(), "results": results}
+
+
+def _metadata():
+    """Describe the commit, interpreter and libraries the results belong to."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "machine": platform.node(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+    }
+
+
+def _format(record):
+    """Format a result record for printing."""
+    value = record["value"]
+    if value is None:
+        return "skipped"
+    if record["unit"] == "seconds":
+        for scale, suffix in ((1, "s"), (1e-3, "ms"), (1e-6, "us")):
+            if value >= scale:
+                return f"{value / scale:8.3f} {suffix}"
+        return f"{value * 1e9:8.3f} ns"
+    if record["unit"] == "bytes":
+        return f"{value / 2**20:8.3f} MiB"
+    return f"{value:8.4g}"
+
+
+def compare(old, new, factor=1.1):
+    """
+    Compare two sets of results.
+
+    Args:
+        old (dict): Results of `run` for the baseline.
+        new (dict): Results of `run` for the contender.
+        factor (float, optional): Ratio above which a result counts as a regression (and
+            below whose inverse as an improvement). Defaults to 1.1.
+
+    Returns:
+        list: `(name, old_value, new_value, ratio, mark)` for every benchmark present in both,
+        where `mark` is `'+'` for regressions, `'-'` for improvements and `''` otherwise.
+    """
+    rows = []
+    for key in sorted(set(old["results"]) & set(new["results"])):
+        a, b = old["results"][key]["value"], new["results"][key]["value"]
+        if a is None or b is None:
+            continue
+        ratio = b / a if a else float("inf") if b else 1.0
+        mark = "+" if ratio > factor else "-" if ratio < 1 / factor else ""
+        rows.append((key, a, b, ratio, mark))
+    return rows
+
+
+def main(argv=None):
+    """Run the benchmarks or compare results from the command line."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks and store the results")
+    run_parser.add_argument("-b", "--bench", help="regular expression selecting benchmarks by name")
+    run_parser.add_argument("-o", "--output", help="JSON file for the results")
+    run_parser.add_argument("-r", "--repeat", type=int, default=5, help="timing samples per benchmark")
+    run_parser.add_argument("-q", "--quick", action="store_true", help="call every benchmark only once")
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("old", help="results of the baseline")
+    compare_parser.add_argument("new", help="results of the contender")
+    compare_parser.add_argument("-f", "--factor", type=float, default=1.1, help="regression threshold")
+    compare_parser.add_argument("--only-changed", action="store_true", help="list only changed results")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(args.bench, repeat=args.repeat, quick=args.quick)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json.dump(results, file, indent=1)
+        return 0
+
+    with open(args.old, encoding="utf-8") as file:
+        old = json.load(file)
+    with open(args.new, encoding="utf-8") as file:
+        new = json.load(file)
+    rows = compare(old, new, args.factor)
+    for key, a, b, ratio, mark in rows:
+        if mark or not args.only_changed:
+            unit = old["results"][key]["unit"]
+            print(
+                f"{mark:1} {_format({'unit': unit, 'value': a})} {_format({'unit': unit, 'value': b})}",
+                end="",
+            )
+            print(f" {ratio:6.2f}  {key}")
+    return 1 if any(mark == "+" for *_, mark in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
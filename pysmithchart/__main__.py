@@ -0,0 +1,7 @@
+"""Command line interface, e.g. ``python -m pysmithchart render "data/*.s1p" -o charts``."""
+
+import sys
+
+from pysmithchart.render import main
+
+sys.exit(main())
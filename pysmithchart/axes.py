@@ -7,24 +7,29 @@ from types import MethodType
 
 import numpy as np
 import matplotlib as mp
+from matplotlib.artist import allow_rasterization
 from matplotlib.axes import Axes
 from matplotlib.cbook import simple_linear_interpolation as linear_interpolation
+from matplotlib.collections import PathCollection
 from matplotlib.legend_handler import HandlerLine2D
 from matplotlib.lines import Line2D
 from matplotlib.markers import MarkerStyle
-from matplotlib.patches import Circle
+from matplotlib.patches import Circle, PathPatch
 from matplotlib.path import Path
 from matplotlib.spines import Spine
 from matplotlib.transforms import Affine2D, BboxTransformTo
 from scipy.interpolate import splprep, splev
 
 from pysmithchart import Z_PARAMETER, Y_PARAMETER, S_PARAMETER
-from pysmithchart import utils
+from pysmithchart import network, perf, utils
+from pysmithchart.circles import arc_paths, circle_paths
 from pysmithchart.constants import SC_DEFAULT_PARAMS, RC_DEFAULT_PARAMS
 from pysmithchart.constants import SC_EPSILON, SC_INFINITY, SC_NEAR_INFINITY, SC_TWICE_INFINITY
+from pysmithchart.geometry import GEOMETRY_CACHE
 from pysmithchart.formatters import RealFormatter, ImagFormatter
+from pysmithchart.lines import ChunkedLine2D
 from pysmithchart.locators import RealMaxNLocator, ImagMaxNLocator, SmithAutoMinorLocator
-from pysmithchart.moebius_transform import MoebiusTransform
+from pysmithchart.moebius_transform import MoebiusTransform, gridline_path
 from pysmithchart.polar_transform import PolarTranslate
 
 __all__ = ["SmithAxes"]
@@ -120,9 +125,13 @@ class SmithAxes(Axes):
                 A deep copy of the default Smith chart parameters (`SmithAxes.scDefaultParams`)
                 for this instance. Modifications to these parameters are unique to the instance.
             _majorarcs (None or list):
-                Holds major arcs on the Smith chart, initialized as `None` and set later during rendering.
+                Holds the `(arc_type, (ps, p0, p1))` records of the major grid arcs, initialized as
+                `None` and set later during rendering.
             _minorarcs (None or list):
-                Holds minor arcs on the Smith chart, initialized as `None` and set later during rendering.
+                Holds the `(arc_type, (ps, p0, p1))` records of the minor grid arcs, initialized as
+                `None` and set later during rendering.
+            _gridlines (dict):
+                The grid artists for `"major"` and `"minor"`, one `PathPatch` per arc type.
             _impedance (None or float):
                 Impedance value used for normalizing Smith chart calculations, if applicable.
             _normalize (None or bool):
@@ -156,6 +165,7 @@ class SmithAxes(Axes):
         self._yaxis_text1_transform = None
         self._majorarcs = None
         self._minorarcs = None
+        self._gridlines = {"major": [], "minor": []}
         self._impedance = None
         self._normalize = None
         self._current_zorder = None
@@ -182,6 +192,44 @@ class SmithAxes(Axes):
             return mp.rcParams[key]
         raise KeyError("%s is not a valid key" % key)
 
+    def _shared_geometry(self, key, factory):
+        """
+        Return geometry from the process-wide cache if `grid.share` is enabled.
+
+        Args:
+            key (tuple): Hashable description of the geometry, without the normalization.
+            factory (callable): Computes the immutable geometry on a cache miss.
+
+        Returns:
+            The geometry computed by `factory`, possibly shared with other axes.
+        """
+        if not self._get_key("grid.share"):
+            return factory()
+        norm = 1 if self._normalize else self._get_key("axes.impedance")
+        return GEOMETRY_CACHE.get(key + (norm,), factory)
+
+    @allow_rasterization
+    @perf.timed("draw")
+    def draw(self, renderer):
+        """Draw the Smith chart, counting the draw if instrumentation is enabled (see `pysmithchart.perf`)."""
+        perf.count("draws")
+        super().draw(renderer)
+
+    def perf_stats(self, reset=False):
+        """
+        Return the timings and counters recorded for this axes.
+
+        Recording is opt-in, see `pysmithchart.perf`.
+
+        Args:
+            reset (bool, optional): Clear the records after reading them. Defaults to `False`.
+
+        Returns:
+            dict: `{"timings": {name: {"calls", "total", "mean", "max"}}, "counters": {name: n}}`,
+            with times in seconds.
+        """
+        return perf.stats(self, reset)
+
     def _init_axis(self):
         self.xaxis = mp.axis.XAxis(self)
         self.yaxis = mp.axis.YAxis(self)
@@ -218,6 +266,7 @@ class SmithAxes(Axes):
         """
         self._majorarcs = []
         self._minorarcs = []
+        self._gridlines = {"major": [], "minor": []}
         original_grid = self.grid
         self.grid = lambda *args, **kwargs: None
         try:
@@ -676,6 +725,14 @@ class SmithAxes(Axes):
                     If `markerhack` is enabled, rotates the end marker in the direction
                     of the corresponding path. Defaults to `False`.
 
+                chunksize (int, optional):
+                    If set, the data (a single complex array, optionally followed by a
+                    format string) is not copied but read and transformed in chunks of
+                    this many points at draw time, keeping only points that fall on
+                    distinct display pixels. A `numpy.memmap` argument enables this mode
+                    with `plot.chunksize` points per chunk. Not available together with
+                    `interpolate`, `equipoints` or `markerhack`. Defaults to `None`.
+
         Returns:
             list[matplotlib.lines.Line2D]:
                 A list of line objects representing the plotted data.
@@ -701,18 +758,10 @@ class SmithAxes(Axes):
                 f"Invalid datatype: {datatype}. Must be S_PARAMETER, Z_PARAMETER, or Y_PARAMETER"
             )
 
-        new_args = ()
-        for arg in args:
-            if not isinstance(arg, (str, np.ndarray)):
-                if isinstance(arg, Number):
-                    arg = np.array([arg], dtype=complex)
-                elif isinstance(arg, Iterable):
-                    arg = np.array(arg, dtype=complex)
-
-            if isinstance(arg, np.ndarray) and arg.dtype in [complex, np.complex128]:
-                new_args += utils.z_to_xy(arg)
-            else:
-                new_args += (arg,)
+        chunksize = kwargs.pop("chunksize", None)
+        data_args = [arg for arg in args if not isinstance(arg, str)]
+        if chunksize is None and len(data_args) == 1 and isinstance(data_args[0], np.memmap):
+            chunksize = self._get_key("plot.chunksize")
 
         if "zorder" not in kwargs:
             kwargs["zorder"] = self._current_zorder
@@ -724,6 +773,24 @@ class SmithAxes(Axes):
         markerhack = kwargs.pop("markerhack", self._get_key("plot.marker.hack"))
         rotate_marker = kwargs.pop("rotate_marker", self._get_key("plot.marker.rotate"))
 
+        if chunksize:
+            if interpolate or equipoints or markerhack:
+                raise ValueError("Interpolation and marker hack are not available for out-of-core data")
+            return [self._plot_chunked(args, datatype, chunksize, **kwargs)]
+
+        new_args = ()
+        for arg in args:
+            if not isinstance(arg, (str, np.ndarray)):
+                if isinstance(arg, Number):
+                    arg = np.array([arg], dtype=complex)
+                elif isinstance(arg, Iterable):
+                    arg = np.asarray(arg, dtype=complex)
+
+            if isinstance(arg, np.ndarray) and np.iscomplexobj(arg):
+                new_args += utils.z_to_xy(arg)
+            else:
+                new_args += (arg,)
+
         if interpolate:
             if equipoints > 0:
                 raise ValueError("Interpolation is not available with equidistant markers")
@@ -778,6 +845,134 @@ class SmithAxes(Axes):
                 self.hack_linedraw(line, rotate_marker)
         return lines
 
+    def _plot_chunked(self, args, datatype, chunksize, **kwargs):
+        """
+        Plot a single complex array without copying it into memory.
+
+        The data is wrapped in a `ChunkedLine2D`, which reads and transforms it in
+        chunks of `chunksize` points at draw time and keeps only the points that land
+        on distinct display pixels. The line style is resolved by
+        `matplotlib.axes.Axes.plot` so that format strings and the color cycle behave
+        as for ordinary lines.
+
+        Args:
+            args (tuple): The complex data, optionally followed by a format string.
+            datatype (str): One of `S_PARAMETER`, `Z_PARAMETER` or `Y_PARAMETER`.
+            chunksize (int): Number of points read and transformed at once.
+            **kwargs: Line properties passed to `matplotlib.axes.Axes.plot`.
+
+        Returns:
+            ChunkedLine2D: The line added to the axes.
+        """
+        fmt = args[1:]
+        if (
+            len(args) == 0
+            or isinstance(args[0], str)
+            or len(fmt) > 1
+            or not all(isinstance(f, str) for f in fmt)
+        ):
+            raise ValueError("Out-of-core plotting takes one complex array and an optional format string")
+        line = ChunkedLine2D(args[0], datatype, chunksize)
+        (template,) = Axes.plot(self, [], [], *fmt, **kwargs)
+        line.update_from(template)
+        line.set_markevery(template.get_markevery())
+        line.set_zorder(template.get_zorder())
+        template.remove()
+        return self.add_line(line)
+
+    def circle(self, center, radius, **kwargs):
+        """
+        Draw circles given by their center and radius in the reflection coefficient plane.
+
+        The parts of the circles inside the chart, |Γ| <= 1, are drawn as exact arcs in a
+        single `matplotlib.collections.PathCollection`, so thousands of circles are drawn
+        without sampling them and without the point-wise Möbius transformation of `plot`.
+        Use `pysmithchart.circles` to compute stability, gain, noise and VSWR circles.
+
+        Args:
+            center (complex or array-like): Centers of the circles in the Γ plane.
+            radius (float or array-like): Radii of the circles, broadcast against `center`.
+            **kwargs: Properties of the `matplotlib.collections.PathCollection`, e.g.
+                `color`, `linestyle`, `linewidth` or `label`. Colors may be given per circle.
+
+        Returns:
+            matplotlib.collections.PathCollection: The added collection.
+        """
+        return self._add_arcs(circle_paths(center, radius), **kwargs)
+
+    def line_arcs(self, load, stop, start=0, z0=None, **kwargs):
+        """
+        Draw how loads move along lossless transmission lines as exact arcs.
+
+        A load seen through a lossless line of characteristic impedance `z0` moves on a circle of
+        constant VSWR with respect to `z0`, which is again a circle on the chart. The part of the
+        circle between the electrical lengths `start` and `stop` is drawn as an exact arc, all
+        arcs in a single `matplotlib.collections.PathCollection`. For a physical length `l` and a
+        frequency sweep from `f0` to `f1` the electrical lengths are `l * f / (vf * c)`. Use
+        `pysmithchart.network.line_transform` for the points themselves and for lossy lines.
+
+        Args:
+            load (complex or array-like): Load impedances in Ohm.
+            stop (float or array-like): Electrical length at the end of the arcs in wavelengths.
+            start (float or array-like, optional): Electrical length at the start of the arcs in
+                wavelengths. Defaults to 0.
+            z0 (float or array-like, optional): Real characteristic impedance of the lines in Ohm.
+                Defaults to the impedance of the chart.
+            **kwargs: Properties of the `matplotlib.collections.PathCollection`, see `circle`.
+
+        Returns:
+            matplotlib.collections.PathCollection: The added collection.
+        """
+        impedance = self._get_key("axes.impedance")
+        z0 = impedance if z0 is None else z0
+        load, start, stop, z0 = [
+            np.ravel(a)
+            for a in np.broadcast_arrays(
+                np.asarray(load, dtype=complex), np.asarray(start, float), np.asarray(stop, float), z0
+            )
+        ]
+        _, gamma_start = network.line_transform(load, z0, wavelengths=start, reference=impedance)
+        _, gamma_stop = network.line_transform(load, z0, wavelengths=stop, reference=impedance)
+
+        # image of the circle |gamma| = a with respect to z0 in the reflection plane of the chart
+        _, gamma_load = network.line_transform(load, z0, wavelengths=0)
+        a = np.abs(gamma_load)
+        q = (z0 - impedance) / (z0 + impedance)
+        p0, p1 = (q + a) / (1 + q * a), (q - a) / (1 - q * a)
+        center, radius = (p0 + p1) / 2, np.abs(p0 - p1) / 2
+
+        theta0 = np.angle(gamma_start - center)
+        theta1 = np.angle(gamma_stop - center)
+        delta = stop - start
+        span = np.where(delta > 0, -((theta0 - theta1) % (2 * np.pi)), (theta1 - theta0) % (2 * np.pi))
+        span = np.where(delta == 0, 0, span)
+        span = np.where(np.abs(delta) >= 0.5, 2 * np.pi, span)
+        return self._add_arcs(arc_paths(center, radius, theta0, span), **kwargs)
+
+    def _add_arcs(self, paths, **kwargs):
+        """
+        Add unfilled paths in the reflection coefficient plane as a single collection.
+
+        Args:
+            paths (list[matplotlib.path.Path]): The paths in the Γ plane.
+            **kwargs: Properties of the `matplotlib.collections.PathCollection`. Without a
+                color, the next color of the property cycle is used.
+
+        Returns:
+            matplotlib.collections.PathCollection: The added collection.
+        """
+        kwargs.setdefault("facecolor", "none")
+        if "color" in kwargs:
+            kwargs.setdefault("edgecolor", kwargs.pop("color"))
+        if "edgecolor" not in kwargs and "edgecolors" not in kwargs:
+            kwargs["edgecolor"] = self._get_lines.get_next_color()
+        if "zorder" not in kwargs:
+            kwargs["zorder"] = self._current_zorder
+            self._current_zorder += 0.001
+        collection = PathCollection(paths, transform=self.transMoebius, **kwargs)
+        return self.add_collection(collection, autolim=False)
+
+    @perf.timed("grid")
     def grid(
         self,
         visible=None,
@@ -874,6 +1069,9 @@ class SmithAxes(Axes):
             assert thr_x > 0 and thr_y > 0
             return (thr_x / 1000, thr_y / 1000)
 
+        def to_key(value):
+            return tuple(value) if np.iterable(value) else value
+
         def add_arc(ps, p0, p1, grid, arc_type):
             """
             Add an arc to the Smith Chart.
@@ -888,37 +1086,76 @@ class SmithAxes(Axes):
                             real or imaginary components.
 
             Side Effects:
-                Appends the created arc to the appropriate list:
+                Appends the arc to the appropriate list:
                 - `_majorarcs` if `grid` is "major".
                 - `_minorarcs` if `grid` is "minor".
 
             Notes:
-                The `param` variable, which holds the styling parameters for the gridline
-                (e.g., z-order, color, etc.), is defined in the enclosing scope.
+                The arcs are only collected here; `add_gridlines` draws them afterwards.
             """
             assert grid in ["major", "minor"]
             assert arc_type in ["real", "imag"]
             assert p0 != p1
+            if arc_type == "real":
+                assert ps >= 0
+            else:
+                assert 0 <= p0 < p1
+            arcs = self._majorarcs if grid == "major" else self._minorarcs
+            arcs.append((arc_type, (ps, p0, p1)))
+
+        def build_geometry(grid, draw, *args):
+            """
+            Compute the arcs of one grid and their compound paths, one per arc type.
+
+            Returns:
+                tuple: `(arcs, paths)` with the arc records and `(arc_type, path)` pairs,
+                both immutable so that they can be shared between axes.
+            """
+            draw(*args)
+            arcs = self._majorarcs if grid == "major" else self._minorarcs
+            perf.count("grid.arcs", len(arcs))
+            paths = []
+            for arc_type in ["real", "imag"]:
+                parts = [gridline_path(self, ps, p0, p1, tp) for tp, (ps, p0, p1) in arcs if tp == arc_type]
+                if parts:
+                    path = Path.make_compound_path(*parts)
+                    paths.append((arc_type, Path(path.vertices, path.codes, readonly=True)))
+            return tuple(arcs), tuple(paths)
+
+        def add_gridlines(grid, fancy, draw, *args):
+            """
+            Draw one grid as one compound path per arc type.
+
+            Drawing all arcs that share a style as a single artist keeps the number of
+            drawn elements independent of the number of arcs, so vector outputs contain
+            a single styled path per family instead of one per arc. The geometry is
+            shared with other axes of identical configuration, see `_shared_geometry`.
+            """
+            key = [
+                "grid",
+                grid,
+                fancy,
+                args,
+                tuple(self.xaxis.get_majorticklocs()),
+                tuple(self.yaxis.get_majorticklocs()),
+            ]
+            if grid == "minor":
+                key += [tuple(self._majorarcs)]
+                if not fancy:
+                    key += [tuple(self.xaxis.get_minor_locator()()), tuple(self.yaxis.get_minor_locator()())]
+            arcs, paths = self._shared_geometry(tuple(key), lambda: build_geometry(grid, draw, *args))
             if grid == "major":
-                arcs = self._majorarcs
-                if arc_type == "real":
-                    param["color"] = self._get_key("grid.major.color.x")
-                else:
-                    param["color"] = self._get_key("grid.major.color.y")
+                self._majorarcs = list(arcs)
             else:
-                arcs = self._minorarcs
-                if arc_type == "real":
-                    param["color"] = self._get_key("grid.minor.color.x")
-                else:
-                    param["color"] = self._get_key("grid.minor.color.y")
-                param["zorder"] -= 1e-09
-            arcs.append(
-                (
-                    arc_type,
-                    (ps, p0, p1),
-                    self._add_gridline(ps, p0, p1, arc_type, **param),
-                )
-            )
+                self._minorarcs = list(arcs)
+
+            param = get_kwargs(grid)
+            for arc_type, path in paths:
+                kw = param.copy()
+                kw["color"] = self._get_key("grid.%s.color.%s" % (grid, "x" if arc_type == "real" else "y"))
+                if grid == "minor":
+                    kw["zorder"] -= 1e-09
+                self._gridlines[grid].append(self._add_gridpatch(path, **kw))
 
         def draw_major_nonfancy():
             xticks = self.xaxis.get_majorticklocs()
@@ -1034,7 +1271,7 @@ class SmithAxes(Axes):
             y_lines = np.round(np.array(y_lines), 7)
             for tp, lines in [("real", x_lines), ("imag", y_lines)]:
                 lines = np.array([[ps, min(p0, p1), max(p0, p1)] for ps, p0, p1 in lines])
-                for tq, (qs, q0, q1), _ in self._majorarcs:
+                for tq, (qs, q0, q1) in self._majorarcs:
                     if tp == tq:
                         overlaps = (
                             (abs(lines[:, 0] - qs) < SC_EPSILON) & (lines[:, 2] > q0) & (lines[:, 1] < q1)
@@ -1061,28 +1298,31 @@ class SmithAxes(Axes):
 
         # draw major grid lines
         if which in ["both", "major"]:
-            for _, _, arc in self._majorarcs:
+            for arc in self._gridlines["major"]:
                 arc.remove()
+            self._gridlines["major"] = []
             self._majorarcs = []
 
             if visible:
-                param = get_kwargs("major")
                 if fancy_major:
-                    draw_major_fancy(threshold)
+                    thr = self._get_key("grid.major.fancy.threshold") if threshold is None else threshold
+                    add_gridlines("major", True, draw_major_fancy, to_key(thr))
                 else:
-                    draw_major_nonfancy()
+                    add_gridlines("major", False, draw_major_nonfancy)
 
         if which in ["both", "minor"]:
-            for _, _, arc in self._minorarcs:
+            for arc in self._gridlines["minor"]:
                 arc.remove()
+            self._gridlines["minor"] = []
             self._minorarcs = []
 
             if visible:
-                param = get_kwargs("minor")
                 if fancy_minor:
-                    draw_minor_fancy(threshold, dividers)
+                    thr = self._get_key("grid.minor.fancy.threshold") if threshold is None else threshold
+                    divs = self._get_key("grid.minor.fancy.dividers") if dividers is None else dividers
+                    add_gridlines("minor", True, draw_minor_fancy, to_key(thr), to_key(divs))
                 else:
-                    draw_minor_nonfancy()
+                    add_gridlines("minor", False, draw_minor_nonfancy)
 
     def hack_linedraw(self, line, rotate_marker):
         """
@@ -1200,45 +1440,33 @@ class SmithAxes(Axes):
             line.draw = MethodType(new_draw, line)
             line.markers_hacked = True
 
-    def _add_gridline(self, ps, p0, p1, arc_type, **kwargs):
+    def _add_gridpatch(self, path, **kwargs):
         """
-        Add a gridline to the Smith chart for the specified arc_type.
-
-        This method creates and adds a gridline (real or imaginary) as a `matplotlib.lines.Line2D`
-        object. Gridlines for the real axis are vertical lines (circles for constant resistance),
-        while gridlines for the imaginary axis are horizontal lines (circles for constant reactance).
+        Add a compound gridline path to the Smith chart.
 
-        For `arc_type='real'`, the gridline is drawn as a vertical line at the position `ps`.
-        The start and end points of the line are defined by `p0` and `p1`.
-
-        For `arc_type='imag'`, the gridline is drawn as a horizontal line at the position `ps`.
-        The line spans between `p0` and `p1`.
-
-        The `_interpolation_steps` property is set for efficient rendering,
-        distinguishing between "x_gridline" and "y_gridline" types.
+        The path holds all arcs of one grid family in Möbius space and is drawn as a
+        single unfilled `matplotlib.patches.PathPatch` with the `transMoebius` transform.
+        The Line2D-style keywords used for gridlines (`color`, `dashes`, `dash_capstyle`
+        and `solid_capstyle`) are translated to the corresponding patch properties.
 
         Args:
-            ps (float): The axis value for the gridline:
-                - For `arc_type='real'`, this represents the resistance value.
-                - For `arc_type='imag'`, this represents the reactance value.
-            p0 (float): The start point of the gridline.
-            p1 (float): The end point of the gridline.
-            arc_type (str): The type of gridline to add. Must be either:
-                - `'real'`: Gridline for the real axis (constant resistance).
-                - `'imag'`: Gridline for the imaginary axis (constant reactance).
+            path (matplotlib.path.Path): The gridlines in Möbius space.
             **kwargs:
-                Additional keyword arguments passed to the `matplotlib.lines.Line2D`
+                Additional keyword arguments passed to the `matplotlib.patches.PathPatch`
                 constructor. These can be used to customize the gridline's appearance
                 (e.g., color, linestyle, linewidth).
+
+        Returns:
+            matplotlib.patches.PathPatch: The added patch.
         """
-        assert arc_type in ["real", "imag"]
-        if arc_type == "real":
-            assert ps >= 0
-            line = Line2D(2 * [ps], [p0, p1], **kwargs)
-            line.get_path()._interpolation_steps = "x_gridline"  # pylint: disable=protected-access
-        else:
-            assert 0 <= p0 < p1
-            line = Line2D([p0, p1], 2 * [ps], **kwargs)
-            if abs(ps) > SC_EPSILON:
-                line.get_path()._interpolation_steps = "y_gridline"  # pylint: disable=protected-access
-        return self.add_artist(line)
+        kwargs["fill"] = False
+        if "color" in kwargs:
+            kwargs["edgecolor"] = kwargs.pop("color")
+        dashes = kwargs.pop("dashes", None)
+        if dashes is not None:
+            kwargs["linestyle"] = (0, dashes)
+        for key in ["dash_capstyle", "solid_capstyle"]:
+            if key in kwargs:
+                kwargs.setdefault("capstyle", kwargs.pop(key))
+        patch = PathPatch(path, transform=self.transMoebius, **kwargs)
+        return self.add_artist(patch)
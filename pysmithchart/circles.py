@@ -0,0 +1,249 @@
+"""
+This module computes circles in the reflection coefficient (Γ) plane.
+
+Stability, constant-gain, noise-figure and VSWR circles are circles in the Γ
+plane. The functions in this module compute their centers and radii vectorized
+over frequency (and over the requested gains or noise figures) and return them as
+`(center, radius)` pairs, which `SmithAxes.circle` draws as exact arcs:
+
+    >>> from pysmithchart import circles
+    >>> ax.circle(*circles.stability_circles(s)[1], color="r")
+    >>> ax.circle(*circles.gain_circles(s, gain_db=[10, 12, 14]), color="b")
+
+Two-port S-parameters are arrays of shape (..., 2, 2). Their leading shape, usually
+the number of frequencies, is broadcast against the other arguments.
+
+Functions:
+    arc_paths(center, radius, theta, span):
+        Exact Bézier paths of circular arcs.
+
+    circle_paths(center, radius):
+        Exact Bézier paths of the parts of circles inside the unit circle.
+
+    stability_circles(s):
+        Source and load stability circles of a two-port.
+
+    gain_circles(s, gain_db, plane="load"):
+        Constant operating or available power gain circles.
+
+    noise_circles(nf_db, nf_min_db, gamma_opt, rn, z0=50):
+        Constant noise figure circles.
+
+    vswr_circles(vswr):
+        Circles of constant VSWR.
+"""
+
+import numpy as np
+from matplotlib.path import Path
+
+__all__ = ["arc_paths", "circle_paths", "stability_circles", "gain_circles", "noise_circles", "vswr_circles"]
+
+# Every arc is made of four cubic Bézier segments of at most 90 degrees each.
+_SEGMENTS = 4
+_ARC_CODES = np.array([Path.MOVETO] + [Path.CURVE4] * (3 * _SEGMENTS), dtype=Path.code_type)
+_CIRCLE_CODES = np.append(_ARC_CODES, Path.CLOSEPOLY).astype(Path.code_type)
+_EMPTY = Path(np.empty((0, 2)), readonly=True)
+
+
+def _arc_vertices(center, radius, theta, span):
+    """
+    Compute the Bézier control points of circular arcs.
+
+    Args:
+        center (numpy.ndarray): Centers of the circles, shape (N,).
+        radius (numpy.ndarray): Radii of the circles, shape (N,).
+        theta (numpy.ndarray): Start angles in radians, shape (N,).
+        span (numpy.ndarray): Signed arc angles in radians, at most 2 pi in magnitude.
+
+    Returns:
+        numpy.ndarray: Vertices of shape (N, 3 * _SEGMENTS + 1, 2).
+    """
+    angles = theta[:, None] + span[:, None] * np.linspace(0, 1, _SEGMENTS + 1)
+    tangent = (4 / 3 * np.tan(span / (4 * _SEGMENTS)))[:, None]
+    ends = np.exp(1j * angles)
+    vertices = np.empty((len(center), 3 * _SEGMENTS + 1), dtype=complex)
+    vertices[:, 0] = ends[:, 0]
+    vertices[:, 1::3] = ends[:, :-1] * (1 + 1j * tangent)
+    vertices[:, 2::3] = ends[:, 1:] * (1 - 1j * tangent)
+    vertices[:, 3::3] = ends[:, 1:]
+    vertices = center[:, None] + radius[:, None] * vertices
+    return np.stack([vertices.real, vertices.imag], axis=-1)
+
+
+def _arc_path_list(xy, visible, full):
+    """Wrap arc vertices in paths, closing full circles and leaving invisible ones empty."""
+    paths = []
+    for i in range(len(xy)):
+        if not visible[i]:
+            paths.append(_EMPTY)
+        elif full[i]:
+            paths.append(Path(np.vstack([xy[i], xy[i, :1]]), _CIRCLE_CODES, readonly=True))
+        else:
+            paths.append(Path(xy[i], _ARC_CODES, readonly=True))
+    return paths
+
+
+def arc_paths(center, radius, theta, span):
+    """
+    Compute exact Bézier paths of circular arcs in the Γ plane.
+
+    Args:
+        center (complex or array-like): Centers of the circles.
+        radius (float or array-like): Radii of the circles.
+        theta (float or array-like): Start angles in radians.
+        span (float or array-like): Signed arc angles in radians, positive for counterclockwise
+            arcs. Arcs of 2 pi or more are drawn as closed circles.
+
+    Returns:
+        list[matplotlib.path.Path]: One path per arc, in the flattened order of the broadcast
+        arguments. Arcs with a non-finite or zero radius give empty paths.
+    """
+    center, radius, theta, span = [
+        np.ravel(a)
+        for a in np.broadcast_arrays(
+            np.asarray(center, dtype=complex),
+            np.abs(radius),
+            np.asarray(theta, float),
+            np.asarray(span, float),
+        )
+    ]
+    full = np.abs(span) >= 2 * np.pi
+    span = np.clip(span, -2 * np.pi, 2 * np.pi)
+    visible = (
+        np.isfinite(center) & np.isfinite(radius) & np.isfinite(theta) & np.isfinite(span) & (radius > 0)
+    )
+    return _arc_path_list(_arc_vertices(center, radius, theta, span), visible, full)
+
+
+def circle_paths(center, radius):
+    """
+    Compute the parts of circles in the Γ plane that lie inside the unit circle.
+
+    Each part is an exact circular arc, represented by cubic Bézier segments. Circles that
+    lie completely inside the unit circle are closed paths; circles without points inside
+    the unit circle, or with a non-finite center or radius, give empty paths.
+
+    Args:
+        center (complex or array-like): Centers of the circles.
+        radius (float or array-like): Radii of the circles, broadcast against `center`.
+
+    Returns:
+        list[matplotlib.path.Path]: One path per circle, in the flattened order of the
+        broadcast arguments.
+    """
+    center, radius = np.broadcast_arrays(np.asarray(center, dtype=complex), np.asarray(radius, dtype=float))
+    center = center.ravel()
+    radius = np.abs(radius.ravel())
+    d = np.abs(center)
+
+    full = d + radius <= 1
+    visible = np.isfinite(center) & np.isfinite(radius) & (radius > 0) & (d - radius < 1) & (radius - d < 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = np.clip((1 - d**2 - radius**2) / (2 * radius * d), -1, 1)
+    # the visible arc is centered on the side of the circle that faces the origin
+    half = np.where(full, np.pi, np.pi - np.arccos(k))
+    theta = np.angle(center) + np.pi - half
+    return _arc_path_list(_arc_vertices(center, radius, theta, 2 * half), visible, full)
+
+
+def _two_port(s):
+    """Return the S-parameters of shape (..., 2, 2) as four arrays and their determinant."""
+    s = np.asarray(s, dtype=complex)
+    if s.shape[-2:] != (2, 2):
+        raise ValueError("S-parameters must have shape (..., 2, 2).")
+    s11, s12, s21, s22 = s[..., 0, 0], s[..., 0, 1], s[..., 1, 0], s[..., 1, 1]
+    return s11, s12, s21, s22, s11 * s22 - s12 * s21
+
+
+def stability_circles(s):
+    """
+    Compute the source (input) and load (output) stability circles of a two-port.
+
+    The stability circles are the loci of source and load reflection coefficients for
+    which the magnitude of the output or input reflection coefficient equals 1.
+
+    Args:
+        s (array-like): S-parameters of shape (..., 2, 2).
+
+    Returns:
+        tuple: `((source_center, source_radius), (load_center, load_radius))`, each of the
+        leading shape of `s`.
+    """
+    s11, s12, s21, s22, delta = _two_port(s)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        den = np.abs(s11) ** 2 - np.abs(delta) ** 2
+        source = (np.conj(s11 - delta * np.conj(s22)) / den, np.abs(s12 * s21 / den))
+        den = np.abs(s22) ** 2 - np.abs(delta) ** 2
+        load = (np.conj(s22 - delta * np.conj(s11)) / den, np.abs(s12 * s21 / den))
+    return source, load
+
+
+def gain_circles(s, gain_db, plane="load"):
+    """
+    Compute circles of constant power gain of a two-port.
+
+    In the load plane these are the circles of constant operating power gain, in the source
+    plane the circles of constant available power gain.
+
+    Args:
+        s (array-like): S-parameters of shape (..., 2, 2).
+        gain_db (float or array-like): Gain in dB, broadcast against the leading shape of `s`,
+            e.g. `gain_db[:, None]` for several gains at every frequency.
+        plane (str, optional): `'load'` or `'source'`. Defaults to `'load'`.
+
+    Raises:
+        ValueError: If `plane` is invalid.
+
+    Returns:
+        tuple: `(center, radius)`. The radius is NaN where the gain is not achievable.
+    """
+    s11, s12, s21, s22, delta = _two_port(s)
+    if plane == "source":
+        s11, s22 = s22, s11
+    elif plane != "load":
+        raise ValueError("Plane must be 'load' or 'source'.")
+    k = (1 - np.abs(s11) ** 2 - np.abs(s22) ** 2 + np.abs(delta) ** 2) / (2 * np.abs(s12 * s21))
+    g = 10 ** (np.asarray(gain_db, dtype=float) / 10) / np.abs(s21) ** 2
+    den = 1 + g * (np.abs(s22) ** 2 - np.abs(delta) ** 2)
+    center = g * np.conj(s22 - delta * np.conj(s11)) / den
+    with np.errstate(invalid="ignore"):
+        radius = np.sqrt(1 - 2 * k * np.abs(s12 * s21) * g + np.abs(s12 * s21) ** 2 * g**2) / np.abs(den)
+    return center, radius
+
+
+def noise_circles(nf_db, nf_min_db, gamma_opt, rn, z0=50):
+    """
+    Compute circles of constant noise figure in the source plane.
+
+    Args:
+        nf_db (float or array-like): Noise figure of the circles in dB.
+        nf_min_db (float or array-like): Minimum noise figure in dB.
+        gamma_opt (complex or array-like): Optimum source reflection coefficient.
+        rn (float or array-like): Equivalent noise resistance in Ohm.
+        z0 (float, optional): Reference impedance in Ohm. Defaults to 50.
+
+    Returns:
+        tuple: `(center, radius)`, broadcast over all arguments. The radius is NaN for noise
+        figures below the minimum.
+    """
+    f = 10 ** (np.asarray(nf_db, dtype=float) / 10)
+    f_min = 10 ** (np.asarray(nf_min_db, dtype=float) / 10)
+    gamma_opt = np.asarray(gamma_opt, dtype=complex)
+    n = (f - f_min) / (4 * np.asarray(rn, dtype=float) / z0) * np.abs(1 + gamma_opt) ** 2
+    with np.errstate(invalid="ignore"):
+        radius = np.sqrt(n * (n + 1 - np.abs(gamma_opt) ** 2)) / (n + 1)
+    return gamma_opt / (n + 1), radius
+
+
+def vswr_circles(vswr):
+    """
+    Compute circles of constant VSWR, centered at the origin.
+
+    Args:
+        vswr (float or array-like): Voltage standing wave ratios, at least 1.
+
+    Returns:
+        tuple: `(center, radius)`.
+    """
+    vswr = np.asarray(vswr, dtype=float)
+    return np.zeros(vswr.shape, dtype=complex), (vswr - 1) / (vswr + 1)
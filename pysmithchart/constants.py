@@ -61,6 +61,7 @@ Grid Settings:
 
 - ``grid.zorder`` (int): Z-order for grid lines (default: 1).
 - ``grid.locator.precision`` (int): Number of significant decimals per decade (default: 2).
+- ``grid.share`` (bool): Share tick and grid geometry between identical charts (default: True).
 
 Major Grid:
 
@@ -96,6 +97,7 @@ Plot Settings:
 - ``plot.marker.rotate`` (bool): Rotate the end marker in the direction of the line.
 - ``plot.default.datatype``: Default datatype for plots (S, Z, or Y parameter).
 - ``plot.default.interpolation`` (int): Number of interpolated steps between points.
+- ``plot.chunksize`` (int): Points read per chunk when plotting out-of-core data.
 
 Symbol Settings:
 
@@ -165,6 +167,7 @@ SC_DEFAULT_PARAMS = {
     # Grid settings
     "grid.zorder": 1,
     "grid.locator.precision": 2,
+    "grid.share": True,
     # Major grid settings
     "grid.major.enable": True,
     "grid.major.linestyle": "-",
@@ -199,6 +202,7 @@ SC_DEFAULT_PARAMS = {
     "plot.marker.rotate": True,
     "plot.default.datatype": Z_PARAMETER,
     "plot.default.interpolation": 5,
+    "plot.chunksize": 65536,
     # Initialization flag
     "init.updaterc": True,
     # Symbol settings
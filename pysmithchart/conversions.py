@@ -0,0 +1,236 @@
+"""
+This module converts between N-port S, Z and Y parameters.
+
+Network parameters are arrays of shape (F, N, N) with one matrix per frequency; a
+single (N, N) matrix is treated as one frequency. Reference impedances may be a
+scalar, one value per port (N,) or one value per frequency and port (F, N), and may
+be complex. S-parameters are power waves (Kurokawa), which reduce to the usual
+definition for real reference impedances.
+
+All conversions use batched linear solves instead of explicit matrix inverses. The
+frequencies are processed in chunks of `CONVERSION_CHUNKSIZE` matrices that are
+written into a single preallocated result, so the temporary memory is bounded
+independently of the number of frequencies.
+
+Example:
+    >>> from pysmithchart.conversions import renormalize
+    >>> s75 = renormalize(s, z_new=75, z_old=50)
+    >>> plt.plot(s75[:, 0, 0], datatype="S")
+
+Functions:
+    s2z(s, z0=50), z2s(z, z0=50):
+        Convert between S and Z parameters.
+
+    s2y(s, z0=50), y2s(y, z0=50):
+        Convert between S and Y parameters.
+
+    z2y(z), y2z(y):
+        Convert between Z and Y parameters.
+
+    renormalize(s, z_new, z_old=50):
+        Change the reference impedances of S-parameters.
+"""
+
+import numpy as np
+
+__all__ = ["CONVERSION_CHUNKSIZE", "s2z", "z2s", "s2y", "y2s", "z2y", "y2z", "renormalize"]
+
+#: Number of matrices converted at once.
+CONVERSION_CHUNKSIZE = 4096
+
+
+def _prepare(p, z0=None):
+    """
+    Return the parameters as an (F, N, N) array and the reference impedances as an (F, N) array.
+
+    Args:
+        p (array-like): Network parameters of shape (F, N, N) or (N, N).
+        z0 (complex or array-like, optional): Reference impedances.
+
+    Returns:
+        tuple: `(p, z0, squeeze)`, where `squeeze` tells whether the input was a single matrix.
+    """
+    p = np.asarray(p, dtype=complex)
+    squeeze = p.ndim == 2
+    if squeeze:
+        p = p[None]
+    if p.ndim != 3 or p.shape[1] != p.shape[2]:
+        raise ValueError("Network parameters must have shape (F, N, N) or (N, N).")
+    if z0 is not None:
+        z0 = np.asarray(z0, dtype=complex)
+        if z0.ndim == 0:
+            z0 = np.full(p.shape[1], z0)
+        try:
+            z0 = np.broadcast_to(z0, p.shape[:2])
+        except ValueError as e:
+            raise ValueError("Reference impedances must be a scalar or of shape (N,) or (F, N).") from e
+    return p, z0, squeeze
+
+
+def _chunked(func, p, *args):
+    """Apply `func` to chunks of the matrices `p` and of the (F, N) arrays `args`."""
+    out = np.empty_like(p)
+    for i in range(0, len(p), CONVERSION_CHUNKSIZE):
+        chunk = slice(i, i + CONVERSION_CHUNKSIZE)
+        out[chunk] = func(p[chunk], *[arg[chunk] for arg in args])
+    return out
+
+
+def _solve_right(a, b):
+    """Return `a @ inv(b)` for stacks of matrices without computing the inverse."""
+    return np.linalg.solve(np.swapaxes(b, -1, -2), np.swapaxes(a, -1, -2)).swapaxes(-1, -2)
+
+
+def _factors(z0):
+    """Return the power-wave scaling `1 / (2 sqrt(|Re z0|))` for each port."""
+    return 0.5 / np.sqrt(np.abs(z0.real))
+
+
+def _s2z(s, z0):
+    """Z = F^-1 (I - S)^-1 (S G + G*) F for one chunk."""
+    f = _factors(z0)
+    eye = np.eye(s.shape[-1])
+    z = np.linalg.solve(eye - s, s * z0[:, None, :] + np.conj(z0)[:, :, None] * eye)
+    return z * f[:, None, :] / f[:, :, None]
+
+
+def _z2s(z, z0):
+    """S = F (Z - G*) (Z + G)^-1 F^-1 for one chunk."""
+    f = _factors(z0)
+    eye = np.eye(z.shape[-1])
+    s = _solve_right(z - np.conj(z0)[:, :, None] * eye, z + z0[:, :, None] * eye)
+    return s * f[:, :, None] / f[:, None, :]
+
+
+def _s2y(s, z0):
+    """Y = F^-1 (S G + G*)^-1 (I - S) F for one chunk."""
+    f = _factors(z0)
+    eye = np.eye(s.shape[-1])
+    y = np.linalg.solve(s * z0[:, None, :] + np.conj(z0)[:, :, None] * eye, eye - s)
+    return y * f[:, None, :] / f[:, :, None]
+
+
+def _y2s(y, z0):
+    """S = F (I - G* Y) (I + G Y)^-1 F^-1 for one chunk."""
+    f = _factors(z0)
+    eye = np.eye(y.shape[-1])
+    s = _solve_right(eye - np.conj(z0)[:, :, None] * y, eye + z0[:, :, None] * y)
+    return s * f[:, :, None] / f[:, None, :]
+
+
+def _inverse(p):
+    """Invert one chunk of matrices by solving against the identity."""
+    return np.linalg.solve(p, np.broadcast_to(np.eye(p.shape[-1]), p.shape))
+
+
+def _convert(func, p, z0=None):
+    """Prepare the arguments, convert in chunks and restore the shape of the input."""
+    p, z0, squeeze = _prepare(p, z0)
+    out = _chunked(func, p) if z0 is None else _chunked(func, p, z0)
+    return out[0] if squeeze else out
+
+
+def s2z(s, z0=50):
+    """
+    Convert S-parameters to Z-parameters.
+
+    Args:
+        s (array-like): S-parameters of shape (F, N, N) or (N, N).
+        z0 (complex or array-like, optional): Reference impedances in Ohm, a scalar or of shape
+            (N,) or (F, N). Defaults to 50.
+
+    Returns:
+        numpy.ndarray: Z-parameters in Ohm, with the shape of `s`.
+    """
+    return _convert(_s2z, s, z0)
+
+
+def z2s(z, z0=50):
+    """
+    Convert Z-parameters to S-parameters.
+
+    Args:
+        z (array-like): Z-parameters in Ohm of shape (F, N, N) or (N, N).
+        z0 (complex or array-like, optional): Reference impedances in Ohm, a scalar or of shape
+            (N,) or (F, N). Defaults to 50.
+
+    Returns:
+        numpy.ndarray: S-parameters, with the shape of `z`.
+    """
+    return _convert(_z2s, z, z0)
+
+
+def s2y(s, z0=50):
+    """
+    Convert S-parameters to Y-parameters.
+
+    Args:
+        s (array-like): S-parameters of shape (F, N, N) or (N, N).
+        z0 (complex or array-like, optional): Reference impedances in Ohm, a scalar or of shape
+            (N,) or (F, N). Defaults to 50.
+
+    Returns:
+        numpy.ndarray: Y-parameters in S, with the shape of `s`.
+    """
+    return _convert(_s2y, s, z0)
+
+
+def y2s(y, z0=50):
+    """
+    Convert Y-parameters to S-parameters.
+
+    Args:
+        y (array-like): Y-parameters in S of shape (F, N, N) or (N, N).
+        z0 (complex or array-like, optional): Reference impedances in Ohm, a scalar or of shape
+            (N,) or (F, N). Defaults to 50.
+
+    Returns:
+        numpy.ndarray: S-parameters, with the shape of `y`.
+    """
+    return _convert(_y2s, y, z0)
+
+
+def z2y(z):
+    """
+    Convert Z-parameters to Y-parameters.
+
+    Args:
+        z (array-like): Z-parameters in Ohm of shape (F, N, N) or (N, N).
+
+    Returns:
+        numpy.ndarray: Y-parameters in S, with the shape of `z`.
+    """
+    return _convert(_inverse, z)
+
+
+def y2z(y):
+    """
+    Convert Y-parameters to Z-parameters.
+
+    Args:
+        y (array-like): Y-parameters in S of shape (F, N, N) or (N, N).
+
+    Returns:
+        numpy.ndarray: Z-parameters in Ohm, with the shape of `y`.
+    """
+    return _convert(_inverse, y)
+
+
+def renormalize(s, z_new, z_old=50):
+    """
+    Change the reference impedances of S-parameters.
+
+    Args:
+        s (array-like): S-parameters of shape (F, N, N) or (N, N) with respect to `z_old`.
+        z_new (complex or array-like): New reference impedances in Ohm, a scalar or of shape
+            (N,) or (F, N).
+        z_old (complex or array-like, optional): Current reference impedances in Ohm.
+            Defaults to 50.
+
+    Returns:
+        numpy.ndarray: S-parameters with respect to `z_new`, with the shape of `s`.
+    """
+    s, z_old, squeeze = _prepare(s, z_old)
+    _, z_new, _ = _prepare(s, z_new)
+    out = _chunked(lambda p, zo, zn: _z2s(_s2z(p, zo), zn), s, z_old, z_new)
+    return out[0] if squeeze else out
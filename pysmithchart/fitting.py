@@ -0,0 +1,218 @@
+"""
+This module fits rational functions to frequency responses by vector fitting.
+
+Spline interpolation in the Γ plane has no physical meaning between sparse frequency
+points. A rational fit instead models the response as a sum of pole-residue terms
+
+    f(s) = d + s e + sum_k r_k / (s - p_k),    s = 2 pi j f,
+
+which is how lumped and distributed networks actually behave. The fit is computed once
+from a few samples and can then be evaluated densely and cheaply at any frequency.
+
+All traces share one set of poles (as the entries of an N-port do), so many traces are
+fitted and evaluated together. Poles come in complex conjugate pairs and the residues
+are paired accordingly, which keeps the fitted responses real in the time domain.
+Unstable poles are flipped into the left half-plane.
+
+Example:
+    >>> from pysmithchart.fitting import vector_fit
+    >>> fit = vector_fit(freq, s11, n_poles=6)
+    >>> dense = np.linspace(freq[0], freq[-1], 2001)
+    >>> plt.plot(fit(dense), datatype="S")
+
+Reference:
+    B. Gustavsen and A. Semlyen, "Rational approximation of frequency domain responses
+    by vector fitting," IEEE Trans. Power Delivery, vol. 14, no. 3, pp. 1052-1061, 1999.
+
+Classes:
+    RationalFit:
+        Pole-residue model of one or more traces.
+
+Functions:
+    vector_fit(freq, data, n_poles=8, n_iter=10, proportional=False):
+        Fit a rational function to frequency responses.
+"""
+
+import numpy as np
+
+__all__ = ["RationalFit", "vector_fit"]
+
+
+class RationalFit:
+    """
+    Pole-residue model of one or more frequency responses with common poles.
+
+    Attributes:
+        poles (numpy.ndarray): Poles in rad/s, shape (P,), in conjugate pairs.
+        residues (numpy.ndarray): Residues, shape (..., P), one row per trace.
+        constant (numpy.ndarray): Constant terms, shape (...).
+        proportional (numpy.ndarray): Coefficients of `s`, shape (...).
+    """
+
+    def __init__(self, poles, residues, constant, proportional):
+        """Initialize the model from its poles, residues and polynomial terms."""
+        self.poles = np.asarray(poles, dtype=complex)
+        self.residues = np.asarray(residues, dtype=complex)
+        self.constant = np.asarray(constant, dtype=float)
+        self.proportional = np.asarray(proportional, dtype=float)
+
+    def __repr__(self):
+        """Return a short description of the model."""
+        return f"RationalFit({len(self.poles)} poles, traces={self.residues.shape[:-1]})"
+
+    def __call__(self, freq):
+        """
+        Evaluate the model.
+
+        Args:
+            freq (array-like): Frequencies in Hz, shape (F,).
+
+        Returns:
+            numpy.ndarray: Responses of shape (..., F).
+        """
+        s = 2j * np.pi * np.asarray(freq, dtype=float).ravel()
+        shape = self.residues.shape[:-1]
+        residues = self.residues.reshape(-1, len(self.poles))
+        out = (1 / (s[:, None] - self.poles)) @ residues.T
+        out += self.constant.reshape(-1) + s[:, None] * self.proportional.reshape(-1)
+        return out.T.reshape(shape + (len(s),))
+
+    def rms_error(self, freq, data):
+        """
+        Compute the root-mean-square deviation of the model from samples.
+
+        Args:
+            freq (array-like): Frequencies in Hz, shape (F,).
+            data (array-like): Responses of shape (..., F).
+
+        Returns:
+            numpy.ndarray: RMS error of every trace, shape (...).
+        """
+        return np.sqrt(np.mean(np.abs(self(freq) - np.asarray(data)) ** 2, axis=-1))
+
+
+def _initial_poles(omega, n_poles):
+    """Return lightly damped conjugate pairs spread linearly over the band, plus one real pole if odd."""
+    imag = np.linspace(max(omega[0], omega[-1] / 100), omega[-1], n_poles // 2)
+    pairs = -imag / 100 + 1j * imag
+    poles = np.stack([pairs, pairs.conj()], axis=-1).ravel()
+    if n_poles % 2:
+        poles = np.append(-omega[-1] / 2 + 0j, poles)
+    return poles
+
+
+def _basis(s, poles):
+    """
+    Return the real-coefficient partial fraction basis, shape (F, P).
+
+    Real poles contribute `1/(s - p)`; a conjugate pair contributes `1/(s - p) + 1/(s - p*)`
+    and `j/(s - p) - j/(s - p*)`.
+    """
+    phi = 1 / (s[:, None] - poles)
+    upper = np.flatnonzero(poles.imag > 0)
+    basis = phi.copy()
+    basis[:, upper] = phi[:, upper] + phi[:, upper + 1]
+    basis[:, upper + 1] = 1j * (phi[:, upper] - phi[:, upper + 1])
+    return basis
+
+
+def _to_residues(poles, coefficients):
+    """Convert real basis coefficients (..., P) into complex residues (..., P)."""
+    residues = coefficients.astype(complex)
+    upper = np.flatnonzero(poles.imag > 0)
+    residues[..., upper] = coefficients[..., upper] + 1j * coefficients[..., upper + 1]
+    residues[..., upper + 1] = residues[..., upper].conj()
+    return residues
+
+
+def _relocate(poles, coefficients):
+    """Return the zeros of `sigma(s) = 1 + sum c_k basis_k(s)`, which become the new poles."""
+    n = len(poles)
+    a = np.zeros((n, n))
+    b = np.zeros(n)
+    for k in range(n):
+        if poles[k].imag == 0:
+            a[k, k] = poles[k].real
+            b[k] = 1
+        elif poles[k].imag > 0:
+            a[k : k + 2, k : k + 2] = [[poles[k].real, poles[k].imag], [-poles[k].imag, poles[k].real]]
+            b[k] = 2
+    zeros = np.linalg.eigvals(a - np.outer(b, coefficients))
+    zeros = np.where(zeros.real > 0, -zeros.conj(), zeros)
+    return _sort_poles(zeros)
+
+
+def _sort_poles(poles):
+    """Order real poles first, then conjugate pairs with the positive imaginary part first."""
+    poles = np.where(np.abs(poles.imag) < 1e-12 * np.abs(poles), poles.real + 0j, poles)
+    real = np.sort(poles[poles.imag == 0].real) + 0j
+    upper = np.sort_complex(poles[poles.imag > 0])
+    return np.concatenate([real, np.stack([upper, upper.conj()], axis=-1).ravel()])
+
+
+def _stack(m):
+    """Stack real and imaginary parts of complex rows into real rows."""
+    return np.concatenate([m.real, m.imag], axis=-2)
+
+
+def vector_fit(freq, data, n_poles=8, n_iter=10, proportional=False):
+    """
+    Fit a rational function to frequency responses by vector fitting.
+
+    All traces are fitted with one common set of poles. The pole relocation uses a QR
+    decomposition of every trace, batched over the traces, and the final residues of all
+    traces are obtained from a single least-squares solve.
+
+    Args:
+        freq (array-like): Sample frequencies in Hz, shape (F,), increasing and positive.
+        data (array-like): Complex responses of shape (..., F), e.g. reflection coefficients.
+        n_poles (int, optional): Number of poles. Defaults to 8.
+        n_iter (int, optional): Number of pole relocation iterations. Defaults to 10.
+        proportional (bool, optional): Whether to fit a term proportional to `s`.
+            Defaults to `False`.
+
+    Raises:
+        ValueError: If there are fewer samples than unknowns of the fit.
+
+    Returns:
+        RationalFit: The fitted model.
+    """
+    freq = np.asarray(freq, dtype=float)
+    data = np.asarray(data, dtype=complex)
+    shape = data.shape[:-1]
+    data = data.reshape(-1, len(freq))
+    n_poly = 2 if proportional else 1
+    if 2 * len(freq) <= 2 * n_poles + n_poly:
+        raise ValueError("Not enough samples for the requested number of poles.")
+
+    # scale s to the band for better conditioning; the poles are scaled back at the end
+    scale = 2 * np.pi * freq[-1]
+    s = 2j * np.pi * freq / scale
+    poles = _initial_poles(np.abs(s), n_poles)
+    poly = np.stack([np.ones_like(s), s][:n_poly], axis=-1)
+
+    for _ in range(n_iter):
+        basis = _basis(s, poles)
+        # rows of [basis, poly, -data * basis] for every trace
+        left = np.concatenate([basis, poly], axis=-1)
+        a = np.concatenate(
+            [np.broadcast_to(left, (len(data),) + left.shape), -data[:, :, None] * basis], axis=-1
+        )
+        # QR of [A | f]: the rows of R that only involve the sigma coefficients, stacked over traces
+        n_left = left.shape[-1]
+        r = np.linalg.qr(np.concatenate([_stack(a), _stack(data[:, :, None])], axis=-1), mode="r")
+        rows = slice(n_left, n_left + n_poles)
+        r22 = r[:, rows, rows].reshape(-1, n_poles)
+        rhs = r[:, rows, -1].ravel()
+        sigma = np.linalg.lstsq(r22, rhs, rcond=None)[0]
+        poles = _relocate(poles, sigma)
+
+    basis = _stack(np.concatenate([_basis(s, poles), poly], axis=-1))
+    coefficients = np.linalg.lstsq(basis, _stack(data.T), rcond=None)[0].T
+    residues = _to_residues(poles, coefficients[:, :n_poles]) * scale
+    return RationalFit(
+        poles * scale,
+        residues.reshape(shape + (n_poles,)),
+        coefficients[:, n_poles].reshape(shape),
+        (coefficients[:, n_poles + 1] / scale if proportional else np.zeros(len(data))).reshape(shape),
+    )
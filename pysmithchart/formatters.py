@@ -1,6 +1,7 @@
 """This module contains the implementation for formatters."""
 
 from matplotlib.ticker import Formatter
+from . import perf
 from .constants import SC_EPSILON, SC_NEAR_INFINITY
 
 __all__ = ["RealFormatter", "ImagFormatter"]
@@ -42,6 +43,7 @@ class RealFormatter(Formatter):
         super().__init__(*args, **kwargs)
         self.axes = axes
 
+    @perf.timed("labels")
     def __call__(self, x, pos=None):
         """
         Format the given tick value.
@@ -77,6 +79,7 @@ class ImagFormatter(RealFormatter):
             The parent `SmithAxes` instance associated with this formatter.
     """
 
+    @perf.timed("labels")
     def __call__(self, x, pos=None):
         """
         Format the given tick value for the imaginary axis.
@@ -0,0 +1,90 @@
+"""
+This module contains the cache for grid geometry shared between Smith charts.
+
+Smith chart axes with the same configuration compute identical locator ticks and
+identical grid arcs. When ``grid.share`` is enabled (the default), these results
+are stored in a process-wide cache and reused by every axes with the same
+configuration. A figure with many identical Smith subplots (or a long series of
+identical figures) therefore computes its grid geometry only once.
+
+Cached values are immutable: tick arrays are read-only, arc records are tuples
+and grid paths are read-only `matplotlib.path.Path` objects. Each axes still owns
+its artists, so styling one chart never affects another.
+
+Example:
+    >>> from pysmithchart.geometry import GEOMETRY_CACHE
+    >>> GEOMETRY_CACHE.stats()
+    {'hits': 126, 'misses': 2, 'size': 2, 'maxsize': 128}
+"""
+
+from collections import OrderedDict
+import threading
+
+from . import perf
+
+__all__ = ["GeometryCache", "GEOMETRY_CACHE"]
+
+
+class GeometryCache:
+    """
+    A thread-safe, bounded least-recently-used cache for immutable geometry.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept in the cache.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to compute the value.
+    """
+
+    def __init__(self, maxsize=128):
+        """Initialize an empty cache holding at most `maxsize` entries."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key, factory):
+        """
+        Return the value for `key`, calling `factory()` to compute it on a miss.
+
+        Args:
+            key (tuple): Hashable description of everything the value depends on.
+            factory (callable): Computes the value; it must return an immutable object.
+
+        Returns:
+            The cached or newly computed value.
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                perf.count("geometry.hits")
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+            perf.count("geometry.misses")
+            value = factory()
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Return the hit and miss counters and the current size as a dict."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+#: The process-wide cache used by `SmithAxes`.
+GEOMETRY_CACHE = GeometryCache()
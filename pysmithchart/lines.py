@@ -0,0 +1,102 @@
+"""This module contains the implementation for out-of-core line artists."""
+
+import numpy as np
+from matplotlib.lines import Line2D
+
+from . import utils
+from .constants import S_PARAMETER, Y_PARAMETER
+
+__all__ = ["ChunkedLine2D"]
+
+
+class ChunkedLine2D(Line2D):
+    """
+    A line that reads its data in chunks at draw time.
+
+    The source array (e.g. a `numpy.memmap` or any object supporting the buffer
+    protocol) is referenced, never copied. When the line is drawn, the source is
+    read `chunksize` points at a time, mapped into Möbius space and then to display
+    space, and consecutive points that fall onto the same display pixel are dropped.
+    Only the reduced points are kept, so the memory used by the line is bounded by
+    the size of the chunks and the length of the trace in pixels, not by the size of
+    the source.
+
+    The reduction is recomputed whenever the display transform changes (e.g. on a
+    resize or a change of DPI). Until the line has been drawn, `get_data` returns
+    empty arrays.
+
+    Attributes:
+        source (numpy.ndarray): One-dimensional complex view of the data source.
+        datatype (str): One of `S_PARAMETER`, `Z_PARAMETER` or `Y_PARAMETER`.
+        chunksize (int): Number of points read and transformed at once.
+    """
+
+    def __init__(self, source, datatype, chunksize, **kwargs):
+        """
+        Initialize the line.
+
+        Args:
+            source (array-like): One-dimensional complex data. Buffer-protocol objects
+                and memory maps are wrapped without copying.
+            datatype (str): Data format of `source`, as for `SmithAxes.plot`.
+            chunksize (int): Number of points read and transformed at once.
+            **kwargs: Keyword arguments passed to `matplotlib.lines.Line2D`.
+        """
+        super().__init__([], [], **kwargs)
+        source = np.asarray(source)
+        if source.ndim != 1 or not np.iscomplexobj(source):
+            raise ValueError("Out-of-core data must be a one-dimensional complex array.")
+        if chunksize <= 0:
+            raise ValueError("`chunksize` must be greater than 0.")
+        self.source = source
+        self.datatype = datatype
+        self.chunksize = int(chunksize)
+        self._reduced_key = None
+
+    def to_gamma(self, data):
+        """Map a chunk of source data to the reflection coefficient (Möbius space)."""
+        axes = self.axes
+        if self.datatype == S_PARAMETER:
+            return data
+        if self.datatype == Y_PARAMETER:
+            return axes.moebius_z(1 / data)
+        if axes._normalize:  # pylint: disable=protected-access
+            data = data / axes._get_key("axes.impedance")  # pylint: disable=protected-access
+        return axes.moebius_z(data)
+
+    def reduced_gamma(self):
+        """
+        Read the source in chunks and reduce it in display space.
+
+        Returns:
+            numpy.ndarray: The reflection coefficients of the points that land on a new
+            display pixel, always including the first and the last point.
+        """
+        trans = self.axes.transMoebius
+        n = len(self.source)
+        pieces = []
+        last = None
+        for start in range(0, n, self.chunksize):
+            gamma = np.asarray(self.to_gamma(np.asarray(self.source[start : start + self.chunksize])))
+            pixels = np.rint(trans.transform(np.column_stack(utils.z_to_xy(gamma))))
+            keep = np.empty(len(gamma), dtype=bool)
+            keep[1:] = np.any(pixels[1:] != pixels[:-1], axis=1)
+            keep[0] = last is None or bool(np.any(pixels[0] != last))
+            if start + self.chunksize >= n:
+                keep[-1] = True
+            pieces.append(gamma[keep])
+            last = pixels[-1]
+        if not pieces:
+            return np.zeros(0, dtype=complex)
+        return np.concatenate(pieces)
+
+    def draw(self, renderer):
+        """Reduce the source for the current display transform and draw the line."""
+        if not self.get_visible():
+            return
+        key = tuple(self.axes.transMoebius.get_matrix().ravel())
+        if key != self._reduced_key:
+            x, y = utils.z_to_xy(self.axes.moebius_inv_z(self.reduced_gamma()))
+            self.set_data(x, y)
+            self._reduced_key = key
+        super().draw(renderer)
@@ -0,0 +1,276 @@
+"""
+This module contains loaders for measured sweep files.
+
+Parsing large text measurement files is slow, so every loader can optionally keep a
+binary sidecar next to the source file (or in a separate cache directory). The
+sidecar is a single ``.npy`` array that is memory-mapped on reload, so subsequent
+loads are zero-copy. Each sidecar has a small ``.json`` companion that records the
+source path, size and modification time; a stale sidecar is rebuilt automatically.
+
+Functions:
+    load_csv(file_path, cache=False, cache_dir=None):
+        Loads a CSV file with a frequency column followed by real/imaginary column pairs.
+
+    load_touchstone(file_path, cache=False, cache_dir=None):
+        Loads S-parameters from a Touchstone (``.sNp``) file.
+
+    load_sweep(file_path, cache=False, cache_dir=None):
+        Loads a CSV or Touchstone file based on the file extension.
+
+    prune_cache(cache_dir):
+        Removes sidecar files whose source file is missing or has changed.
+
+Example:
+    >>> from pysmithchart.loaders import load_csv
+    >>> freq, s11 = load_csv("s11.csv", cache=True)
+"""
+
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+
+__all__ = ["load_csv", "load_touchstone", "load_sweep", "prune_cache"]
+
+SIDECAR_VERSION = 1
+
+_TOUCHSTONE_UNITS = {"hz": 1.0, "khz": 1e3, "mhz": 1e6, "ghz": 1e9}
+_TOUCHSTONE_PORTS = re.compile(r"\.s(\d+)p$", re.IGNORECASE)
+
+
+def _sidecar_paths(file_path, cache_dir):
+    """Return the paths of the ``.npy`` sidecar and its ``.json`` metadata."""
+    source = os.path.abspath(file_path)
+    if cache_dir is None:
+        cache_dir = os.path.dirname(source)
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+    stem = os.path.join(cache_dir, "%s.%s" % (os.path.basename(source), digest))
+    return stem + ".npy", stem + ".json"
+
+
+def _source_stamp(file_path):
+    """Return the fields used to validate a sidecar against its source file."""
+    stat = os.stat(file_path)
+    return {
+        "version": SIDECAR_VERSION,
+        "source": os.path.abspath(file_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def _read_sidecar(file_path, cache_dir):
+    """Return the memory-mapped sidecar for `file_path`, or None if missing or stale."""
+    npy_path, json_path = _sidecar_paths(file_path, cache_dir)
+    try:
+        with open(json_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if any(meta.get(key) != value for key, value in _source_stamp(file_path).items()):
+            return None
+        table = np.load(npy_path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    return _split_table(table, tuple(meta["shape"]))
+
+
+def _write_sidecar(file_path, cache_dir, freq, data):
+    """Write `freq` and `data` as a sidecar table for `file_path`."""
+    npy_path, json_path = _sidecar_paths(file_path, cache_dir)
+    os.makedirs(os.path.dirname(npy_path), exist_ok=True)
+    n = len(freq)
+    table = np.empty((n, 1 + 2 * (data.size // max(n, 1))), dtype=np.float64)
+    table[:, 0] = freq
+    table[:, 1:] = np.ascontiguousarray(data, dtype=np.complex128).reshape(n, -1).view(np.float64)
+    meta = _source_stamp(file_path)
+    meta["shape"] = list(data.shape[1:])
+
+    # write to temporary files first so that a concurrent reader never sees a partial sidecar
+    with open(npy_path + ".tmp", "wb") as f:
+        np.save(f, table)
+    os.replace(npy_path + ".tmp", npy_path)
+    with open(json_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(json_path + ".tmp", json_path)
+
+
+def _split_table(table, shape):
+    """Split a (F, 1 + 2K) float table into frequency and complex data views."""
+    freq = table[:, 0]
+    data = table[:, 1:].view(np.complex128)
+    return freq, data.reshape((len(freq),) + shape)
+
+
+def _cached(parse, file_path, cache, cache_dir):
+    """Call `parse(file_path)`, optionally going through the binary sidecar cache."""
+    if cache:
+        result = _read_sidecar(file_path, cache_dir)
+        if result is not None:
+            return result
+    freq, data = parse(file_path)
+    if cache:
+        _write_sidecar(file_path, cache_dir, freq, data)
+    return freq, data
+
+
+def _parse_csv(file_path):
+    table = np.loadtxt(file_path, delimiter=",", skiprows=1, ndmin=2)
+    if table.shape[1] < 3 or table.shape[1] % 2 != 1:
+        raise ValueError("CSV file must have a frequency column followed by real/imaginary column pairs.")
+    data = table[:, 1::2] + 1j * table[:, 2::2]
+    if data.shape[1] == 1:
+        data = data[:, 0]
+    return table[:, 0], data
+
+
+def _parse_touchstone(file_path):
+    match = _TOUCHSTONE_PORTS.search(file_path)
+    if match is None:
+        raise ValueError("Touchstone file name must end with '.sNp': %s" % file_path)
+    ports = int(match.group(1))
+
+    unit, parameter, fmt = "ghz", "s", "ma"
+    tokens = []
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.split("!", 1)[0].strip()
+            if not line:
+                continue
+            if line.startswith("#"):
+                options = line[1:].lower().split()
+                for option in options:
+                    if option in _TOUCHSTONE_UNITS:
+                        unit = option
+                    elif option in ["s", "y", "z", "g", "h"]:
+                        parameter = option
+                    elif option in ["ri", "ma", "db"]:
+                        fmt = option
+                continue
+            if line.startswith("["):
+                raise ValueError("Touchstone 2.0 keywords are not supported: %s" % line)
+            tokens.extend(line.split())
+
+    if parameter != "s":
+        raise ValueError("Only S-parameter Touchstone files are supported.")
+
+    columns = 1 + 2 * ports * ports
+    values = np.array(tokens, dtype=float)
+    if values.size % columns != 0:
+        raise ValueError("Touchstone data does not match %d ports." % ports)
+    values = values.reshape(-1, columns)
+
+    a, b = values[:, 1::2], values[:, 2::2]
+    if fmt == "ri":
+        data = a + 1j * b
+    elif fmt == "ma":
+        data = a * np.exp(1j * np.radians(b))
+    else:
+        data = 10 ** (a / 20) * np.exp(1j * np.radians(b))
+
+    data = data.reshape(-1, ports, ports)
+    if ports == 2:
+        # two-port files list the parameters in the order S11, S21, S12, S22
+        data = data.transpose(0, 2, 1)
+    elif ports == 1:
+        data = data[:, 0, 0]
+    return values[:, 0] * _TOUCHSTONE_UNITS[unit], data
+
+
+def load_csv(file_path, cache=False, cache_dir=None):
+    """
+    Load a sweep from a CSV file.
+
+    The file must have a single header row, a frequency column and one or more pairs of
+    real and imaginary columns.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        cache (bool, optional): If True, read from and write to a binary sidecar. Defaults to False.
+        cache_dir (str, optional): Directory for the sidecar. Defaults to the directory of `file_path`.
+
+    Returns:
+        tuple: `(freq, data)` where `freq` has shape (F,) and `data` is complex with shape (F,)
+        for a single trace or (F, K) for K traces. Arrays loaded from a sidecar are read-only
+        memory-mapped views.
+    """
+    return _cached(_parse_csv, file_path, cache, cache_dir)
+
+
+def load_touchstone(file_path, cache=False, cache_dir=None):
+    """
+    Load S-parameters from a Touchstone 1.x file.
+
+    The number of ports is taken from the ``.sNp`` file extension. The RI, MA and DB
+    formats are supported, and frequencies are converted to Hz.
+
+    Args:
+        file_path (str): Path to the Touchstone file.
+        cache (bool, optional): If True, read from and write to a binary sidecar. Defaults to False.
+        cache_dir (str, optional): Directory for the sidecar. Defaults to the directory of `file_path`.
+
+    Returns:
+        tuple: `(freq, s)` where `freq` has shape (F,) and `s` is complex with shape (F,) for
+        one-port files or (F, N, N) for N-port files.
+
+    Raises:
+        ValueError: If the file is not an S-parameter file or the data does not match the port count.
+    """
+    return _cached(_parse_touchstone, file_path, cache, cache_dir)
+
+
+def load_sweep(file_path, cache=False, cache_dir=None):
+    """
+    Load a CSV or Touchstone file, chosen by the file extension.
+
+    Args:
+        file_path (str): Path to a ``.csv`` or ``.sNp`` file.
+        cache (bool, optional): If True, read from and write to a binary sidecar. Defaults to False.
+        cache_dir (str, optional): Directory for the sidecar. Defaults to the directory of `file_path`.
+
+    Returns:
+        tuple: `(freq, data)` as returned by `load_csv` or `load_touchstone`.
+    """
+    if _TOUCHSTONE_PORTS.search(file_path):
+        return load_touchstone(file_path, cache, cache_dir)
+    return load_csv(file_path, cache, cache_dir)
+
+
+def prune_cache(cache_dir):
+    """
+    Remove stale sidecar files from a cache directory.
+
+    A sidecar is stale if its source file no longer exists or its size or
+    modification time has changed.
+
+    Args:
+        cache_dir (str): Directory to scan for sidecars.
+
+    Returns:
+        list[str]: The paths of the removed files.
+    """
+    removed = []
+    for name in sorted(os.listdir(cache_dir)):
+        if not name.endswith(".json"):
+            continue
+        json_path = os.path.join(cache_dir, name)
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if not isinstance(meta, dict) or meta.get("version") != SIDECAR_VERSION or "source" not in meta:
+            continue
+
+        source = meta["source"]
+        try:
+            stale = any(meta.get(key) != value for key, value in _source_stamp(source).items())
+        except OSError:
+            stale = True
+        if stale:
+            npy_path = json_path[: -len(".json")] + ".npy"
+            for path in [npy_path, json_path]:
+                if os.path.exists(path):
+                    os.remove(path)
+                    removed.append(path)
+    return removed
@@ -3,6 +3,7 @@
 from matplotlib.ticker import AutoMinorLocator, Locator
 import numpy as np
 
+from . import perf
 from .constants import SC_EPSILON, SC_INFINITY
 from .utils import ang_to_c
 
@@ -33,12 +34,24 @@ class RealMaxNLocator(Locator):
 
         self.ticks = None
 
+    @perf.timed("locator")
     def __call__(self):
         """Compute or return cached tick values."""
         if self.ticks is None:
-            self.ticks = self.tick_values(0, SC_INFINITY)
+            self.ticks = self._shared_ticks(lambda: self.tick_values(0, SC_INFINITY))
         return self.ticks
 
+    def _shared_ticks(self, factory):
+        """Look up the tick values in the axes' shared geometry cache, see `SmithAxes._shared_geometry`."""
+
+        def compute():
+            ticks = np.asarray(factory())
+            ticks.flags.writeable = False
+            return ticks
+
+        key = ("ticks", type(self).__name__, self.steps, self.precision)
+        return self.axes._shared_geometry(key, compute)  # pylint: disable=protected-access
+
     def nice_round(self, num, down=True):
         """
         Round a number to a nicely rounded value based on precision.
@@ -127,11 +140,16 @@ class ImagMaxNLocator(RealMaxNLocator):
         """Initialize the ImagMaxNLocator."""
         super().__init__(axes, n // 2, precision)
 
+    @perf.timed("locator")
     def __call__(self):
         """Compute or return cached tick values for the imaginary axis."""
         if self.ticks is None:
-            tmp = self.tick_values(0, SC_INFINITY)
-            self.ticks = np.concatenate((-tmp[:0:-1], tmp))
+
+            def compute():
+                tmp = self.tick_values(0, SC_INFINITY)
+                return np.concatenate((-tmp[:0:-1], tmp))
+
+            self.ticks = self._shared_ticks(compute)
         return self.ticks
 
     def out_of_range(self, x):
@@ -0,0 +1,343 @@
+"""
+This module synthesizes lossless matching networks.
+
+Every function computes all solution branches of one network topology at once and
+is vectorized over the load impedance and the reference impedance `z0`, which are
+broadcast against each other. Typically the load is a frequency sweep and each
+frequency gets its own element values. Branches that do not exist for a load are
+marked invalid and their values are NaN.
+
+Each branch is returned as a `MatchingSolution` with the element values, the
+reflection coefficients at the load and after each element, and the matching path
+on the Smith chart, which can be plotted directly:
+
+    >>> from pysmithchart import S_PARAMETER, matching
+    >>> solutions = matching.single_stub(load, z0=50, stub="short")
+    >>> for solution in solutions:
+    ...     plt.plot(solution.path()[0], datatype=S_PARAMETER)
+
+Classes:
+    MatchingSolution: One solution branch of a matching network.
+
+Functions:
+    l_network(load, z0=50):
+        Two-element lumped (L-section) matching networks.
+
+    single_stub(load, z0=50, stub="short"):
+        A line section followed by a shunt stub.
+
+    double_stub(load, z0=50, spacing=0.125, stub="short"):
+        Two shunt stubs at a fixed spacing, the first one at the load.
+"""
+
+import numpy as np
+
+from . import network
+from .utils import vswr_rotation
+
+__all__ = ["MatchingSolution", "l_network", "single_stub", "double_stub"]
+
+
+class MatchingSolution:
+    """
+    One solution branch of a matching network.
+
+    Elements are listed from the load towards the source as `(kind, value)` pairs:
+
+    - `'series'`: series reactance in Ohm.
+    - `'shunt'`: shunt susceptance in S.
+    - `'line'`: length of a line section in wavelengths.
+    - `'open_stub'`, `'short_stub'`: length of a shunt stub in wavelengths.
+
+    Lines and stubs have the characteristic impedance `z0`.
+
+    Attributes:
+        topology (str): Name of the topology, e.g. `'shunt-series'`.
+        z0 (numpy.ndarray): Reference impedance in Ohm.
+        load (numpy.ndarray): Load impedance in Ohm.
+        elements (list[tuple]): The elements as `(kind, values)` pairs.
+        gamma (numpy.ndarray): Reflection coefficients at the load and after each
+            element, with a trailing axis of length `len(elements) + 1`.
+        valid (numpy.ndarray): False where this branch does not exist.
+    """
+
+    def __init__(self, topology, z0, load, steps):
+        """
+        Create a solution from its elements.
+
+        Args:
+            topology (str): Name of the topology.
+            z0 (numpy.ndarray): Reference impedance in Ohm.
+            load (numpy.ndarray): Load impedance in Ohm.
+            steps (list[tuple]): `(kind, value, move)` triples, where `value` is given in the
+                units of `MatchingSolution.elements` and `move` describes the effect of the
+                element on the chart: `('z', x)` adds the normalized reactance `x`, `('y', b)`
+                adds the normalized susceptance `b` and `('rot', d)` moves `d` wavelengths
+                towards the source.
+        """
+        self.topology = topology
+        self.z0 = z0
+        self.load = load
+        self._moves = [move for _, _, move in steps]
+        self.valid = np.ones(np.shape(load), dtype=bool)
+        for _, value in self._moves:
+            self.valid &= np.isfinite(value)
+        self.elements = [(kind, np.where(self.valid, value, np.nan)) for kind, value, _ in steps]
+        self.gamma = self.path(steps=1)
+
+    def __repr__(self):
+        """Return a short description of the solution."""
+        kinds = ", ".join(kind for kind, _ in self.elements)
+        return "MatchingSolution(%s: %s)" % (self.topology, kinds)
+
+    def path(self, steps=32):
+        """
+        Compute the matching path on the Smith chart.
+
+        Each element moves along its circle of the chart: series reactances along circles
+        of constant resistance, shunt elements and stubs along circles of constant
+        conductance and line sections along circles of constant VSWR.
+
+        Args:
+            steps (int, optional): Points per element. Defaults to 32.
+
+        Returns:
+            numpy.ndarray: Reflection coefficients with a trailing axis of length
+            `len(elements) * steps + 1`, NaN where the branch does not exist.
+        """
+        t = np.linspace(0, 1, steps + 1)[1:]
+        z = np.where(self.valid, self.load / self.z0, np.nan)
+        points = [_gamma(z)[..., None]]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for mode, value in self._moves:
+                value = np.where(self.valid, value, np.nan)[..., None]
+                if mode == "z":
+                    points.append(_gamma(z[..., None] + 1j * value * t))
+                elif mode == "y":
+                    points.append(_gamma(1 / (1 / z[..., None] + 1j * value * t)))
+                else:
+                    points.append(_gamma(z)[..., None] * np.exp(-4j * np.pi * value * t))
+                z = _impedance(points[-1][..., -1])
+        return np.concatenate(points, axis=-1)
+
+    def components(self, freq):
+        """
+        Convert the lumped elements to inductors and capacitors.
+
+        Args:
+            freq (array-like): Frequencies in Hz, broadcast against the element values.
+
+        Returns:
+            list[dict]: For each `'series'` or `'shunt'` element, a dict with the keys
+            `kind`, `inductance` (H) and `capacitance` (F). At every frequency exactly one of
+            `inductance` and `capacitance` is finite.
+        """
+        omega = 2 * np.pi * np.asarray(freq, dtype=float)
+        result = []
+        for kind, value in self.elements:
+            if kind not in ["series", "shunt"]:
+                continue
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if kind == "series":
+                    inductance = np.where(value >= 0, value / omega, np.nan)
+                    capacitance = np.where(value < 0, -1 / (omega * value), np.nan)
+                else:
+                    inductance = np.where(value < 0, -1 / (omega * value), np.nan)
+                    capacitance = np.where(value >= 0, value / omega, np.nan)
+            result.append({"kind": kind, "inductance": inductance, "capacitance": capacitance})
+        return result
+
+    def network(self, freq, velocity_factor=1):
+        """
+        Build the matching network as a two-port from the source to the load.
+
+        Args:
+            freq (array-like): Frequencies in Hz, shape (F,), matching the shape of the load.
+            velocity_factor (float, optional): Velocity factor of lines and stubs. Defaults to 1.
+
+        Returns:
+            pysmithchart.network.Network: The matching network.
+        """
+        freq = np.asarray(freq, dtype=float)
+        wavelength = velocity_factor * network.SPEED_OF_LIGHT / freq
+        blocks = []
+        for kind, value in reversed(self.elements):
+            if kind == "series":
+                blocks.append(network.series_impedance(freq, 1j * value))
+            elif kind == "shunt":
+                with np.errstate(invalid="ignore"):
+                    z = np.divide(1, 1j * value, out=np.full(value.shape, np.inf, complex), where=value != 0)
+                    blocks.append(network.shunt_impedance(freq, z))
+            elif kind == "line":
+                blocks.append(network.transmission_line(freq, value * wavelength, self.z0, velocity_factor))
+            else:
+                termination = kind.split("_")[0]
+                blocks.append(
+                    network.shunt_stub(freq, value * wavelength, self.z0, termination, velocity_factor)
+                )
+        return network.cascade(*blocks)
+
+
+def _gamma(z):
+    """Reflection coefficient of the normalized impedance `z`."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (z - 1) / (z + 1)
+
+
+def _impedance(gamma):
+    """Normalized impedance of the reflection coefficient `gamma`."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (1 + gamma) / (1 - gamma)
+
+
+def _prepare(load, z0):
+    """Broadcast `load` and `z0` and return them with the normalized load impedance."""
+    load, z0 = np.broadcast_arrays(np.asarray(load, dtype=complex), np.asarray(z0, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return load, z0, load / z0
+
+
+def _sqrt(x):
+    """Square root that is NaN for negative arguments."""
+    with np.errstate(invalid="ignore"):
+        return np.sqrt(x)
+
+
+def _check_stub(stub):
+    """Raise a `ValueError` if `stub` is not a valid stub termination."""
+    if stub not in ["open", "short"]:
+        raise ValueError("Stub must be 'open' or 'short'.")
+
+
+def _stub_length(b, stub):
+    """Return the length in wavelengths of a stub with the normalized susceptance `b`."""
+    b = np.asarray(b)
+    if stub == "open":
+        return (np.arctan(b) / (2 * np.pi)) % 0.5
+    with np.errstate(divide="ignore"):
+        return (np.arctan(-1 / b) / (2 * np.pi)) % 0.5
+
+
+def l_network(load, z0=50):
+    """
+    Compute all two-element lumped matching networks.
+
+    The `'shunt-series'` topology places the shunt element at the load and exists for loads
+    with a normalized conductance of at most 1. The `'series-shunt'` topology places the
+    series element at the load and exists for loads with a normalized resistance of at most 1.
+
+    Args:
+        load (complex or array-like): Load impedance in Ohm.
+        z0 (float or array-like, optional): Reference impedance in Ohm. Defaults to 50.
+
+    Returns:
+        list[MatchingSolution]: Two `'shunt-series'` and two `'series-shunt'` branches.
+    """
+    load, z0, zl = _prepare(load, z0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        yl = 1 / zl
+    solutions = []
+    for sign in [1, -1]:
+        g = np.where(yl.real > 0, yl.real, np.nan)
+        b = -yl.imag + sign * _sqrt(g * (1 - g))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = -np.imag(1 / (yl + 1j * b))
+        steps = [("shunt", b / z0, ("y", b)), ("series", x * z0, ("z", x))]
+        solutions.append(MatchingSolution("shunt-series", z0, load, steps))
+    for sign in [1, -1]:
+        r = np.where(zl.real > 0, zl.real, np.nan)
+        x = -zl.imag + sign * _sqrt(r * (1 - r))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            b = -np.imag(1 / (zl + 1j * x))
+        steps = [("series", x * z0, ("z", x)), ("shunt", b / z0, ("y", b))]
+        solutions.append(MatchingSolution("series-shunt", z0, load, steps))
+    return solutions
+
+
+def single_stub(load, z0=50, stub="short"):
+    """
+    Compute both single-stub matching networks.
+
+    A line section of length `d` moves the load along its circle of constant VSWR onto the
+    circle of unit conductance, where a shunt stub cancels the remaining susceptance. The
+    rotation is computed with `pysmithchart.utils.vswr_rotation` in the admittance plane.
+
+    Args:
+        load (complex or array-like): Load impedance in Ohm.
+        z0 (float or array-like, optional): Characteristic impedance of line and stub in Ohm.
+            Defaults to 50.
+        stub (str, optional): Termination of the stub, `'open'` or `'short'`. Defaults to
+            `'short'`.
+
+    Raises:
+        ValueError: If `stub` is invalid.
+
+    Returns:
+        list[MatchingSolution]: The two branches, which exist for every passive load that is
+        not purely reactive.
+    """
+    _check_stub(stub)
+    load, z0, zl = _prepare(load, z0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        admittance = z0 / zl  # admittance scaled by z0**2, so that its Smith chart point is -gamma
+    solutions = []
+    for solution2 in [False, True]:
+        _, y1, rotation = vswr_rotation(
+            np.atleast_1d(admittance.real),
+            np.atleast_1d(admittance.imag),
+            impedance=np.atleast_1d(z0),
+            real=np.atleast_1d(z0),
+            solution2=solution2,
+            direction="cw",
+        )
+        d = np.where(np.isfinite(admittance), -rotation.reshape(load.shape) % 0.5, np.nan)
+        b = -np.imag(y1).reshape(load.shape) / z0
+        steps = [("line", d, ("rot", d)), ("%s_stub" % stub, _stub_length(b, stub), ("y", b))]
+        solutions.append(MatchingSolution("single-stub", z0, load, steps))
+    return solutions
+
+
+def double_stub(load, z0=50, spacing=0.125, stub="short"):
+    """
+    Compute both double-stub matching networks.
+
+    The first stub is connected at the load, the second one `spacing` wavelengths towards
+    the source. Loads with a normalized conductance above `1 + 1 / tan(2 pi spacing)**2`
+    cannot be matched.
+
+    Args:
+        load (complex or array-like): Load impedance in Ohm.
+        z0 (float or array-like, optional): Characteristic impedance of lines and stubs in Ohm.
+            Defaults to 50.
+        spacing (float, optional): Distance of the stubs in wavelengths. Defaults to 0.125.
+        stub (str, optional): Termination of both stubs, `'open'` or `'short'`. Defaults to
+            `'short'`.
+
+    Raises:
+        ValueError: If `stub` or `spacing` is invalid.
+
+    Returns:
+        list[MatchingSolution]: The two branches.
+    """
+    _check_stub(stub)
+    t = np.tan(2 * np.pi * spacing)
+    if not np.isfinite(t) or abs(t) < 1e-12:
+        raise ValueError("`spacing` must not be a multiple of a quarter wavelength.")
+    load, z0, zl = _prepare(load, z0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        yl = 1 / zl
+    g = np.where(yl.real > 0, yl.real, np.nan)
+    solutions = []
+    for sign in [1, -1]:
+        b1 = -yl.imag + (1 + sign * _sqrt((1 + t**2) * g - g**2 * t**2)) / t
+        y1 = g + 1j * (yl.imag + b1)
+        with np.errstate(invalid="ignore"):
+            y2 = (y1 + 1j * t) / (1 + 1j * t * y1)
+        b2 = -y2.imag
+        steps = [
+            ("%s_stub" % stub, _stub_length(b1, stub), ("y", b1)),
+            ("line", np.full(np.shape(load), spacing), ("rot", spacing)),
+            ("%s_stub" % stub, _stub_length(b2, stub), ("y", b2)),
+        ]
+        solutions.append(MatchingSolution("double-stub", z0, load, steps))
+    return solutions
@@ -1,15 +1,88 @@
 """This module contains the implementation for moebius transform."""
 
-from collections.abc import Iterable
-
-from matplotlib.patches import Arc
 from matplotlib.path import Path
 from matplotlib.transforms import Transform
 import numpy as np
 
+from . import perf
+from .constants import SC_EPSILON
 from .utils import z_to_xy
 
-__all__ = ["MoebiusTransform", "InvertedMoebiusTransform"]
+__all__ = ["MoebiusTransform", "InvertedMoebiusTransform", "gridline_path"]
+
+#: Number of points transformed at once, which bounds the size of temporary arrays.
+TRANSFORM_CHUNKSIZE = 65536
+
+
+def _transform_chunked(func, values):
+    """
+    Apply a complex mapping to (x, y) points in chunks.
+
+    Args:
+        func (callable): Mapping called as `func(x, y)` that returns complex values.
+        values (array-like): A single point (x, y) or an array of points with shape (N, 2).
+
+    Returns:
+        numpy.ndarray: The transformed points with the same shape as `values`.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        return np.array(z_to_xy(func(values[0], values[1])), dtype=float)
+    out = np.empty(values.shape, dtype=float)
+    for start in range(0, len(values), TRANSFORM_CHUNKSIZE):
+        block = values[start : start + TRANSFORM_CHUNKSIZE]
+        z = func(block[:, 0], block[:, 1])
+        out[start : start + TRANSFORM_CHUNKSIZE, 0] = np.real(z)
+        out[start : start + TRANSFORM_CHUNKSIZE, 1] = np.imag(z)
+    return out
+
+
+def gridline_path(axes, ps, p0, p1, arc_type):
+    """
+    Return a gridline of the Smith chart as a path in Möbius space.
+
+    Lines of constant resistance and constant reactance are mapped to circular arcs.
+    The arcs are emitted as cubic Bézier segments spanning at most 90 degrees each,
+    which is the most compact exact-looking representation supported by all backends.
+    The line of zero reactance maps to a straight line.
+
+    Args:
+        axes (SmithAxes): The axes that defines the normalization.
+        ps (float): Resistance (`arc_type='real'`) or reactance (`arc_type='imag'`) of the line.
+        p0 (float): Start of the line along the other axis.
+        p1 (float): End of the line along the other axis.
+        arc_type (str): Either `'real'` (constant resistance) or `'imag'` (constant reactance).
+
+    Returns:
+        matplotlib.path.Path: The gridline in Möbius space, to be drawn with `axes.transMoebius`.
+    """
+    if arc_type == "real":
+        x, y = np.array([ps, ps]), np.array([p0, p1])
+    else:
+        x, y = np.array([p0, p1]), np.array([ps, ps])
+    z = axes.moebius_z(x, y)
+
+    if arc_type == "real":
+        zm = 0.5 * (1 + axes.moebius_z(ps))
+    elif abs(ps) > SC_EPSILON:
+        if axes._normalize:  # pylint: disable=protected-access
+            scale = 1j
+        else:
+            scale = 1j * axes._get_key("axes.impedance")  # pylint: disable=protected-access
+        zm = 1 + scale / ps
+    else:
+        return Path(np.column_stack(z_to_xy(z)))
+
+    radius = abs(zm - 1)
+    ang0, ang1 = np.angle(z - zm, deg=True) % 360
+    reverse = ang0 > ang1
+    if reverse:
+        ang0, ang1 = (ang1, ang0)
+    arc = Path.arc(ang0, ang1, max(1, int(np.ceil((ang1 - ang0) / 90))))
+    vertices = arc.vertices * radius + z_to_xy(zm)
+    if reverse:
+        vertices = vertices[::-1]
+    return Path(vertices, arc.codes)
 
 
 class BaseMoebiusTransform(Transform):
@@ -41,6 +114,7 @@ class MoebiusTransform(BaseMoebiusTransform):
     and path transformations for visualizing data on the Smith chart.
     """
 
+    @perf.timed("transform")
     def transform_non_affine(self, values):
         """
         Apply the non-affine Möbius transformation to input data.
@@ -50,15 +124,11 @@ class MoebiusTransform(BaseMoebiusTransform):
                 (x, y) or an iterable of points.
 
         Returns:
-            list or tuple: The transformed points in Smith chart data space.
+            numpy.ndarray: The transformed points in Smith chart data space, with the
+            same shape as `values`.
         """
-
-        def moebius_xy(_xy):
-            return z_to_xy(self.axes.moebius_z(*_xy))
-
-        if isinstance(values[0], Iterable):
-            return list(map(moebius_xy, values))
-        return moebius_xy(values)
+        perf.count("transform.points", np.size(values) // 2)
+        return _transform_chunked(self.axes.moebius_z, values)
 
     def transform_path_non_affine(self, path):
         """
@@ -81,44 +151,15 @@ class MoebiusTransform(BaseMoebiusTransform):
         linetype = path._interpolation_steps  # pylint: disable=protected-access
         if linetype in ["x_gridline", "y_gridline"]:
             assert len(vertices) == 2
-            x, y = np.array(list(zip(*vertices)))
-            z = self.axes.moebius_z(x, y)
+            (x0, y0), (x1, y1) = vertices
             if linetype == "x_gridline":
-                assert x[0] == x[1]
-                zm = 0.5 * (1 + self.axes.moebius_z(x[0]))
-            else:
-                assert y[0] == y[1]
-                if self.axes._normalize:  # pylint: disable=protected-access
-                    scale = 1j
-                else:
-                    scale = 1j * self.axes._get_key("axes.impedance")  # pylint: disable=protected-access
-                zm = 1 + scale / y[0]
-            d = 2 * abs(zm - 1)
-            ang0, ang1 = np.angle(z - zm, deg=True) % 360
-            reverse = ang0 > ang1
-            if reverse:
-                ang0, ang1 = (ang1, ang0)
-            arc = Arc(
-                z_to_xy(zm),
-                d,
-                d,
-                theta1=ang0,
-                theta2=ang1,
-                transform=self.axes.transMoebius,
-            )
-            arc._path = Path.arc(ang0, ang1)  # pylint: disable=protected-access
-            arc_path = arc.get_patch_transform().transform_path(arc.get_path())
-            if reverse:
-                new_vertices = arc_path.vertices[::-1]
-            else:
-                new_vertices = arc_path.vertices
-            new_codes = arc_path.codes
-        elif linetype == 1:
-            new_vertices = self.transform_non_affine(vertices)
-            new_codes = codes
-        else:
-            raise NotImplementedError("Value for 'path_interpolation' cannot be interpreted.")
-        return Path(new_vertices, new_codes)
+                assert x0 == x1
+                return gridline_path(self.axes, x0, y0, y1, "real")
+            assert y0 == y1
+            return gridline_path(self.axes, y0, x0, x1, "imag")
+        if linetype == 1:
+            return Path(self.transform_non_affine(vertices), codes)
+        raise NotImplementedError("Value for 'path_interpolation' cannot be interpreted.")
 
     def inverted(self):
         """
@@ -146,6 +187,7 @@ class InvertedMoebiusTransform(BaseMoebiusTransform):
     as the inverse of the `MoebiusTransform` class.
     """
 
+    @perf.timed("transform")
     def transform_non_affine(self, values):
         """
         Apply the non-affine inverse Möbius transformation to input data.
@@ -155,14 +197,11 @@ class InvertedMoebiusTransform(BaseMoebiusTransform):
                 The input data to transform, given as a list of (x, y) points.
 
         Returns:
-            list: The transformed points, mapped from the Smith chart data space
+            numpy.ndarray: The transformed points, mapped from the Smith chart data space
             back to Cartesian coordinates.
         """
-
-        def _moebius_inv_xy(_xy):
-            return z_to_xy(self.axes.moebius_inv_z(*_xy))
-
-        return list(map(_moebius_inv_xy, values))
+        perf.count("transform.points", np.size(values) // 2)
+        return _transform_chunked(self.axes.moebius_inv_z, values)
 
     def inverted(self):
         """
@@ -0,0 +1,414 @@
+"""
+This module implements cascades of two-port networks over frequency.
+
+Two-ports are represented by their ABCD (chain) matrices, stored as arrays of shape
+(F, 2, 2) with one matrix per frequency. Cascading networks is a batched matrix
+product over all frequencies at once, so even sweeps with 100k points are evaluated
+without Python loops. The 2x2 products are written out element by element, which is
+several times faster than `numpy.matmul` on stacks of tiny matrices. The results are
+impedance and reflection coefficient arrays that can be passed directly to
+`SmithAxes.plot`.
+
+Example:
+    >>> import numpy as np
+    >>> from pysmithchart import network
+    >>> f = np.linspace(1e9, 3e9, 1001)
+    >>> match = network.cascade(
+    ...     network.transmission_line(f, 0.02, z0=50),
+    ...     network.shunt_stub(f, 0.01, termination="short"),
+    ... )
+    >>> plt.plot(match.input_impedance(100 - 50j), datatype="Z")
+    >>> plt.plot(match.s11(load=100 - 50j), datatype="S")
+
+Classes:
+    Network: A two-port described by its ABCD matrices over frequency.
+
+Functions:
+    cascade(*networks):
+        Connect two-ports in series from input to output.
+
+    series_impedance(freq, z), shunt_impedance(freq, z):
+        Two-ports of an arbitrary series or shunt impedance.
+
+    series_resistor, series_inductor, series_capacitor, shunt_resistor, shunt_inductor, shunt_capacitor:
+        Two-ports of lumped elements.
+
+    transmission_line(freq, length, ...), shunt_stub(freq, length, ...):
+        Two-ports of transmission-line sections and stubs.
+
+    transformer(freq, n):
+        Two-port of an ideal transformer.
+
+    line_transform(load, z0=50, ...):
+        Impedance seen through a transmission line, broadcast over loads, lengths and frequencies.
+"""
+
+import numpy as np
+
+__all__ = [
+    "SPEED_OF_LIGHT",
+    "Network",
+    "cascade",
+    "series_impedance",
+    "shunt_impedance",
+    "series_resistor",
+    "series_inductor",
+    "series_capacitor",
+    "shunt_resistor",
+    "shunt_inductor",
+    "shunt_capacitor",
+    "transmission_line",
+    "shunt_stub",
+    "transformer",
+    "line_transform",
+]
+
+#: Speed of light in vacuum in m/s.
+SPEED_OF_LIGHT = 299792458.0
+
+
+class Network:
+    """
+    A two-port network described by its ABCD matrices over frequency.
+
+    Networks are cascaded with `cascade` or the `@` operator, e.g. `line @ stub`.
+
+    Attributes:
+        freq (numpy.ndarray): Frequencies in Hz, shape (F,).
+        abcd (numpy.ndarray): Complex ABCD matrices, shape (F, 2, 2).
+    """
+
+    def __init__(self, freq, abcd):
+        """
+        Create a network from its ABCD matrices.
+
+        Args:
+            freq (array-like): Frequencies in Hz, shape (F,).
+            abcd (array-like): ABCD matrices of shape (F, 2, 2) or a single (2, 2) matrix that
+                applies to all frequencies.
+
+        Raises:
+            ValueError: If the shapes of `freq` and `abcd` do not match.
+        """
+        self.freq = np.atleast_1d(np.asarray(freq, dtype=float))
+        if self.freq.ndim != 1:
+            raise ValueError("`freq` must be one-dimensional.")
+        abcd = np.asarray(abcd, dtype=complex)
+        if abcd.shape == (2, 2):
+            abcd = np.broadcast_to(abcd, (len(self.freq), 2, 2))
+        if abcd.shape != (len(self.freq), 2, 2):
+            raise ValueError("`abcd` must have shape (%d, 2, 2), got %s." % (len(self.freq), abcd.shape))
+        self.abcd = abcd
+
+    def __len__(self):
+        """Return the number of frequencies."""
+        return len(self.freq)
+
+    def __repr__(self):
+        """Return a short description of the network."""
+        return "Network(%d frequencies)" % len(self.freq)
+
+    def __matmul__(self, other):
+        """Cascade this network with `other` at its output."""
+        if not isinstance(other, Network):
+            return NotImplemented
+        return cascade(self, other)
+
+    def input_impedance(self, load=np.inf):
+        """
+        Compute the impedance seen at the input with `load` connected to the output.
+
+        Args:
+            load (complex or array-like, optional): Load impedance in Ohm, a scalar or an array
+                of shape (F,). Defaults to infinity (open output).
+
+        Returns:
+            numpy.ndarray: Input impedance in Ohm, shape (F,).
+        """
+        a, b, c, d = self._elements()
+        load = np.asarray(load, dtype=complex)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(np.isinf(load), a / c, (a * load + b) / (c * load + d))
+
+    def s11(self, z0=50, load=None):
+        """
+        Compute the input reflection coefficient with `load` connected to the output.
+
+        Args:
+            z0 (float, optional): Reference impedance in Ohm. Defaults to 50.
+            load (complex or array-like, optional): Load impedance in Ohm. Defaults to `z0`,
+                which gives the S11 parameter of the two-port.
+
+        Returns:
+            numpy.ndarray: Reflection coefficient at the input, shape (F,).
+        """
+        zin = self.input_impedance(z0 if load is None else load)
+        return (zin - z0) / (zin + z0)
+
+    def s_parameters(self, z0=50):
+        """
+        Convert the network to S-parameters.
+
+        Args:
+            z0 (float, optional): Reference impedance of both ports in Ohm. Defaults to 50.
+
+        Returns:
+            numpy.ndarray: S-parameter matrices, shape (F, 2, 2).
+        """
+        a, b, c, d = self._elements()
+        b = b / z0
+        c = c * z0
+        delta = a + b + c + d
+        s = np.empty_like(self.abcd)
+        s[:, 0, 0] = (a + b - c - d) / delta
+        s[:, 0, 1] = 2 * (a * d - b * c) / delta
+        s[:, 1, 0] = 2 / delta
+        s[:, 1, 1] = (-a + b - c + d) / delta
+        return s
+
+    def _elements(self):
+        """Return the four ABCD elements as arrays of shape (F,)."""
+        abcd = self.abcd
+        return abcd[:, 0, 0], abcd[:, 0, 1], abcd[:, 1, 0], abcd[:, 1, 1]
+
+
+def cascade(*networks):
+    """
+    Connect two-port networks in series from input to output.
+
+    Args:
+        *networks (Network): The networks, beginning at the input. All must share the same
+            frequencies.
+
+    Raises:
+        ValueError: If no network is given or the frequencies differ.
+
+    Returns:
+        Network: The cascaded network.
+    """
+    if not networks:
+        raise ValueError("At least one network is required.")
+    freq = networks[0].freq
+    for network in networks[1:]:
+        if network.freq.shape != freq.shape or not np.array_equal(network.freq, freq):
+            raise ValueError("Only networks with the same frequencies can be cascaded.")
+
+    a, b, c, d = networks[0]._elements()  # pylint: disable=protected-access
+    for network in networks[1:]:
+        e, f, g, h = network._elements()  # pylint: disable=protected-access
+        a, b, c, d = a * e + b * g, a * f + b * h, c * e + d * g, c * f + d * h
+    return _from_elements(freq, a, b, c, d)
+
+
+def _frequencies(freq):
+    """Return `freq` as a one-dimensional float array."""
+    return np.atleast_1d(np.asarray(freq, dtype=float))
+
+
+def _from_elements(freq, a, b, c, d):
+    """Build a network from the four ABCD elements, each a scalar or an array of shape (F,)."""
+    abcd = np.empty((len(freq), 2, 2), dtype=complex)
+    abcd[:, 0, 0] = a
+    abcd[:, 0, 1] = b
+    abcd[:, 1, 0] = c
+    abcd[:, 1, 1] = d
+    return Network(freq, abcd)
+
+
+def series_impedance(freq, z):
+    """
+    Create a two-port with the impedance `z` in series.
+
+    Args:
+        freq (array-like): Frequencies in Hz, shape (F,).
+        z (complex or array-like): Impedance in Ohm, a scalar or an array of shape (F,).
+
+    Returns:
+        Network: The two-port.
+    """
+    freq = _frequencies(freq)
+    return _from_elements(freq, 1, z, 0, 1)
+
+
+def shunt_impedance(freq, z):
+    """
+    Create a two-port with the impedance `z` in shunt.
+
+    Args:
+        freq (array-like): Frequencies in Hz, shape (F,).
+        z (complex or array-like): Impedance in Ohm, a scalar or an array of shape (F,).
+
+    Returns:
+        Network: The two-port.
+    """
+    freq = _frequencies(freq)
+    with np.errstate(divide="ignore"):
+        y = 1 / np.asarray(z, dtype=complex)
+    return _from_elements(freq, 1, 0, y, 1)
+
+
+def _reactance(freq, inductance=None, capacitance=None):
+    """Return the impedance of an inductor or a capacitor at `freq`."""
+    omega = 2 * np.pi * _frequencies(freq)
+    if inductance is not None:
+        return 1j * omega * inductance
+    with np.errstate(divide="ignore"):
+        return 1 / (1j * omega * capacitance)
+
+
+def series_resistor(freq, resistance):
+    """Create a two-port with a series resistor, `resistance` in Ohm."""
+    return series_impedance(freq, resistance)
+
+
+def series_inductor(freq, inductance):
+    """Create a two-port with a series inductor, `inductance` in H."""
+    return series_impedance(freq, _reactance(freq, inductance=inductance))
+
+
+def series_capacitor(freq, capacitance):
+    """Create a two-port with a series capacitor, `capacitance` in F."""
+    return series_impedance(freq, _reactance(freq, capacitance=capacitance))
+
+
+def shunt_resistor(freq, resistance):
+    """Create a two-port with a shunt resistor, `resistance` in Ohm."""
+    return shunt_impedance(freq, resistance)
+
+
+def shunt_inductor(freq, inductance):
+    """Create a two-port with a shunt inductor, `inductance` in H."""
+    return shunt_impedance(freq, _reactance(freq, inductance=inductance))
+
+
+def shunt_capacitor(freq, capacitance):
+    """Create a two-port with a shunt capacitor, `capacitance` in F."""
+    return shunt_impedance(freq, _reactance(freq, capacitance=capacitance))
+
+
+def _propagation(freq, length, velocity_factor, loss):
+    """Return the product of the propagation constant and the length of a line."""
+    beta = 2 * np.pi * _frequencies(freq) / (velocity_factor * SPEED_OF_LIGHT)
+    return (loss + 1j * beta) * length
+
+
+def transmission_line(freq, length, z0=50, velocity_factor=1, loss=0):
+    """
+    Create a two-port of a transmission-line section.
+
+    Args:
+        freq (array-like): Frequencies in Hz, shape (F,).
+        length (float): Physical length in m.
+        z0 (float, optional): Characteristic impedance in Ohm. Defaults to 50.
+        velocity_factor (float, optional): Phase velocity relative to the speed of light.
+            Defaults to 1.
+        loss (float, optional): Attenuation constant in Np/m. Defaults to 0.
+
+    Returns:
+        Network: The two-port.
+    """
+    freq = _frequencies(freq)
+    gl = _propagation(freq, length, velocity_factor, loss)
+    cosh, sinh = np.cosh(gl), np.sinh(gl)
+    return _from_elements(freq, cosh, z0 * sinh, sinh / z0, cosh)
+
+
+def shunt_stub(freq, length, z0=50, termination="open", velocity_factor=1, loss=0):
+    """
+    Create a two-port of a stub connected in shunt.
+
+    Args:
+        freq (array-like): Frequencies in Hz, shape (F,).
+        length (float): Physical length of the stub in m.
+        z0 (float, optional): Characteristic impedance in Ohm. Defaults to 50.
+        termination (str, optional): Either `'open'` or `'short'`. Defaults to `'open'`.
+        velocity_factor (float, optional): Phase velocity relative to the speed of light.
+            Defaults to 1.
+        loss (float, optional): Attenuation constant in Np/m. Defaults to 0.
+
+    Raises:
+        ValueError: If `termination` is invalid.
+
+    Returns:
+        Network: The two-port.
+    """
+    gl = _propagation(freq, length, velocity_factor, loss)
+    if termination == "open":
+        y = np.tanh(gl) / z0
+    elif termination == "short":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y = 1 / (z0 * np.tanh(gl))
+    else:
+        raise ValueError("Termination must be 'open' or 'short'.")
+    return _from_elements(_frequencies(freq), 1, 0, y, 1)
+
+
+def transformer(freq, n):
+    """
+    Create a two-port of an ideal transformer.
+
+    Args:
+        freq (array-like): Frequencies in Hz, shape (F,).
+        n (float): Turns ratio from input to output; a load `Z` appears as `n**2 * Z` at the input.
+
+    Returns:
+        Network: The two-port.
+    """
+    return _from_elements(_frequencies(freq), n, 0, 0, 1 / n)
+
+
+def line_transform(
+    load, z0=50, length=None, freq=None, wavelengths=None, velocity_factor=1, loss=0, reference=None
+):
+    """
+    Transform load impedances along a transmission line towards the source.
+
+    All arguments are broadcast against each other, so the same call computes how a load moves
+    along a line of increasing length, how a line-terminated load sweeps with frequency, or both
+    at once, e.g. with `length[:, None]` and `freq[None, :]`. The line length is given either
+    as an electrical length in wavelengths or as a physical length with frequencies.
+
+    Args:
+        load (complex or array-like): Load impedances in Ohm, `inf` for an open line.
+        z0 (float or array-like, optional): Characteristic impedance in Ohm. Defaults to 50.
+        length (float or array-like, optional): Physical length in m, requires `freq`.
+        freq (float or array-like, optional): Frequencies in Hz.
+        wavelengths (float or array-like, optional): Electrical length in wavelengths.
+        velocity_factor (float, optional): Phase velocity relative to the speed of light.
+            Defaults to 1.
+        loss (float or array-like, optional): Attenuation constant in Np/m, requires `length`.
+            Defaults to 0.
+        reference (float, optional): Reference impedance of the returned reflection
+            coefficients in Ohm. Defaults to `z0`.
+
+    Raises:
+        ValueError: If the line length is not specified by exactly one of `wavelengths` and
+            `length` with `freq`, or if `loss` is given without a physical length.
+
+    Returns:
+        tuple: `(z, gamma)`, the impedances in Ohm and the reflection coefficients at the
+        input of the line, broadcast over all arguments.
+    """
+    if (wavelengths is None) == (length is None):
+        raise ValueError("Specify either `wavelengths` or `length` and `freq`.")
+    if length is not None:
+        if freq is None:
+            raise ValueError("A physical `length` requires `freq`.")
+        length = np.asarray(length, dtype=float)
+        wavelengths = length * np.asarray(freq, dtype=float) / (velocity_factor * SPEED_OF_LIGHT)
+        attenuation = np.asarray(loss, dtype=float) * length
+    elif np.any(loss):
+        raise ValueError("`loss` requires a physical `length`.")
+    else:
+        attenuation = 0
+
+    load = np.asarray(load, dtype=complex)
+    with np.errstate(invalid="ignore"):
+        gamma_load = np.where(np.isinf(load), 1, (load - z0) / (load + z0))
+    gamma_in = gamma_load * np.exp(-2 * attenuation - 4j * np.pi * np.asarray(wavelengths, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = z0 * (1 + gamma_in) / (1 - gamma_in)
+    reference = z0 if reference is None else reference
+    with np.errstate(invalid="ignore"):
+        gamma = np.where(np.isinf(z), 1, (z - reference) / (z + reference))
+    return z, gamma
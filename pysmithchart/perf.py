@@ -0,0 +1,331 @@
+"""
+This module contains opt-in instrumentation of the Smith chart hot paths.
+
+When enabled, pysmithchart records wall-clock timings of grid construction, locators,
+tick label formatting, the Möbius transforms and drawing, together with counters for
+transformed points, built grid arcs, geometry cache hits and misses, and draws. Every
+measurement is recorded globally and for the `SmithAxes` it belongs to; work done
+inside a timed axes method (e.g. the transforms called while an axes draws) is
+attributed to that axes.
+
+Instrumentation is disabled by default. Disabled timers and counters return after a
+single flag check, so they add close to zero overhead. It can be enabled with
+`enable()`, temporarily with `profile()`, or for a whole run by setting the
+environment variable ``PYSMITHCHART_PERF=1``.
+
+Example:
+    >>> from pysmithchart import perf
+    >>> with perf.profile():
+    ...     ax = plt.subplot(projection="smith")
+    ...     plt.savefig("chart.png")
+    >>> ax.perf_stats()["timings"]["grid"]
+    {'calls': 2, 'total': 0.031, 'mean': 0.0155, 'max': 0.027}
+    >>> perf.export_chrome_trace("trace.json")  # open in chrome://tracing or Perfetto
+
+Functions:
+    enable(flag=True), disable(), is_enabled():
+        Switch the instrumentation on or off.
+
+    profile():
+        Context manager that enables the instrumentation temporarily.
+
+    timed(name):
+        Decorator that times a method and attributes it to the method's axes.
+
+    timer(name, axes=None), count(name, n=1, axes=None):
+        Record a timing or a counter.
+
+    stats(axes=None, reset=False), reset(axes=None):
+        Read or clear the recorded timings and counters.
+
+    export_chrome_trace(file, axes=None):
+        Write the recorded events in the Chrome trace event format.
+"""
+
+from collections import deque
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+import weakref
+
+__all__ = [
+    "MAX_EVENTS",
+    "enable",
+    "disable",
+    "is_enabled",
+    "profile",
+    "timed",
+    "timer",
+    "count",
+    "stats",
+    "reset",
+    "export_chrome_trace",
+]
+
+#: Maximum number of timing events kept for the Chrome trace; older events are dropped.
+MAX_EVENTS = 100000
+
+_ENABLED = os.environ.get("PYSMITHCHART_PERF", "") not in ("", "0")
+_NULL = contextlib.nullcontext()
+_LOCAL = threading.local()
+_LOCK = threading.Lock()
+
+
+class _Recorder:
+    """Timings, counters and events of one axes or of the whole process."""
+
+    def __init__(self):
+        """Initialize empty records."""
+        self.timings = {}
+        self.counters = {}
+        self.events = deque(maxlen=MAX_EVENTS)
+        self.lock = threading.Lock()
+
+    def add_timing(self, name, start, duration, label):
+        """Record one timed call."""
+        with self.lock:
+            calls, total, longest = self.timings.get(name, (0, 0, 0))
+            self.timings[name] = (calls + 1, total + duration, max(longest, duration))
+            self.events.append((name, start, duration, threading.get_ident(), label))
+
+    def add_count(self, name, n):
+        """Increment a counter."""
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self, reset=False):
+        """Return the timings in seconds and the counters as a dict."""
+        with self.lock:
+            timings = {
+                name: {
+                    "calls": calls,
+                    "total": total * 1e-9,
+                    "mean": total * 1e-9 / calls,
+                    "max": longest * 1e-9,
+                }
+                for name, (calls, total, longest) in sorted(self.timings.items())
+            }
+            result = {"timings": timings, "counters": dict(sorted(self.counters.items()))}
+            if reset:
+                self.clear()
+            return result
+
+    def clear(self):
+        """Remove all records."""
+        with self.lock:
+            self.timings.clear()
+            self.counters.clear()
+            self.events.clear()
+
+
+_GLOBAL = _Recorder()
+_AXES = weakref.WeakKeyDictionary()
+
+
+def _recorder(axes):
+    """Return the recorder of `axes`, creating it on first use."""
+    with _LOCK:
+        recorder = _AXES.get(axes)
+        if recorder is None:
+            recorder = _AXES[axes] = _Recorder()
+        return recorder
+
+
+def _label(axes):
+    """Return a short name that identifies `axes` in traces."""
+    return None if axes is None else "%s@%x" % (type(axes).__name__, id(axes))
+
+
+class _Timer:
+    """Context manager that records the duration of its block."""
+
+    __slots__ = ("name", "axes", "previous", "start")
+
+    def __init__(self, name, axes):
+        """Time the block as `name`, attributed to `axes` or to the enclosing timed axes."""
+        self.name = name
+        self.axes = axes
+        self.previous = None
+        self.start = 0
+
+    def __enter__(self):
+        """Start the timer and make its axes the current axes of this thread."""
+        self.previous = getattr(_LOCAL, "axes", None)
+        if self.axes is None:
+            self.axes = self.previous
+        _LOCAL.axes = self.axes
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop the timer and record the duration."""
+        duration = time.perf_counter_ns() - self.start
+        _LOCAL.axes = self.previous
+        label = _label(self.axes)
+        _GLOBAL.add_timing(self.name, self.start, duration, label)
+        if self.axes is not None:
+            _recorder(self.axes).add_timing(self.name, self.start, duration, label)
+        return False
+
+
+def enable(flag=True):
+    """Enable (or with `flag=False` disable) the instrumentation."""
+    global _ENABLED  # pylint: disable=global-statement
+    _ENABLED = bool(flag)
+
+
+def disable():
+    """Disable the instrumentation."""
+    enable(False)
+
+
+def is_enabled():
+    """Return whether the instrumentation is enabled."""
+    return _ENABLED
+
+
+@contextlib.contextmanager
+def profile():
+    """Enable the instrumentation inside a `with` block and restore the previous state afterwards."""
+    previous = _ENABLED
+    enable()
+    try:
+        yield
+    finally:
+        enable(previous)
+
+
+def timer(name, axes=None):
+    """
+    Return a context manager that records the duration of its block.
+
+    Args:
+        name (str): Name of the timing, e.g. `'grid'`.
+        axes (SmithAxes, optional): Axes the timing belongs to. Defaults to the axes of the
+            enclosing timed block, if any.
+
+    Returns:
+        A context manager; a shared no-op one if the instrumentation is disabled.
+    """
+    if not _ENABLED:
+        return _NULL
+    return _Timer(name, axes)
+
+
+def timed(name):
+    """
+    Decorate a method so that its calls are timed as `name`.
+
+    The calls are attributed to the `axes` attribute of the instance, which is the axes
+    itself for `SmithAxes` and the owning axes for locators, formatters and transforms.
+
+    Args:
+        name (str): Name of the timing.
+
+    Returns:
+        callable: The decorator.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not _ENABLED:
+                return func(self, *args, **kwargs)
+            with _Timer(name, getattr(self, "axes", None)):
+                return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def count(name, n=1, axes=None):
+    """
+    Increment a counter.
+
+    Args:
+        name (str): Name of the counter, e.g. `'transform.points'`.
+        n (int, optional): Increment. Defaults to 1.
+        axes (SmithAxes, optional): Axes the count belongs to. Defaults to the axes of the
+            enclosing timed block, if any.
+    """
+    if not _ENABLED:
+        return
+    _GLOBAL.add_count(name, n)
+    if axes is None:
+        axes = getattr(_LOCAL, "axes", None)
+    if axes is not None:
+        _recorder(axes).add_count(name, n)
+
+
+def stats(axes=None, reset=False):
+    """
+    Return the recorded timings and counters.
+
+    Args:
+        axes (SmithAxes, optional): Return only the records of this axes. Defaults to the
+            records of the whole process.
+        reset (bool, optional): Clear the records after reading them. Defaults to `False`.
+
+    Returns:
+        dict: `{"timings": {name: {"calls", "total", "mean", "max"}}, "counters": {name: n}}`,
+        with times in seconds.
+    """
+    if axes is None:
+        return _GLOBAL.snapshot(reset)
+    return _recorder(axes).snapshot(reset)
+
+
+def reset(axes=None):
+    """Clear the records of `axes`, or all records if `axes` is `None`."""
+    if axes is not None:
+        _recorder(axes).clear()
+        return
+    _GLOBAL.clear()
+    with _LOCK:
+        _AXES.clear()
+
+
+def export_chrome_trace(file, axes=None):
+    """
+    Write the recorded timings as a Chrome trace, viewable in chrome://tracing or Perfetto.
+
+    Every timed call becomes a complete ("X") event on the thread that made it; the final
+    counter values are appended as counter ("C") events.
+
+    Args:
+        file (str or file-like): Path or text file to write the JSON trace to.
+        axes (SmithAxes, optional): Export only the events of this axes. Defaults to all events.
+    """
+    recorder = _GLOBAL if axes is None else _recorder(axes)
+    pid = os.getpid()
+    with recorder.lock:
+        events = list(recorder.events)
+        counters = dict(recorder.counters)
+    trace = [
+        {
+            "name": name,
+            "cat": "pysmithchart",
+            "ph": "X",
+            "ts": start / 1000,
+            "dur": duration / 1000,
+            "pid": pid,
+            "tid": tid,
+            "args": {"axes": label} if label else {},
+        }
+        for name, start, duration, tid, label in events
+    ]
+    end = max((start + duration for _, start, duration, _, _ in events), default=time.perf_counter_ns())
+    trace += [
+        {"name": name, "cat": "pysmithchart", "ph": "C", "ts": end / 1000, "pid": pid, "args": {name: value}}
+        for name, value in counters.items()
+    ]
+    document = {"traceEvents": trace, "displayTimeUnit": "ms"}
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "w", encoding="utf-8") as f:
+            json.dump(document, f)
+    else:
+        json.dump(document, file)
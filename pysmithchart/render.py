@@ -0,0 +1,235 @@
+"""
+This module implements batch rendering of Smith charts from measurement files.
+
+Charts are rendered through a process pool. Each worker builds one
+`SmithChartTemplate` when it starts and reuses it for every file it renders, so
+the cost of setting up the empty chart is paid once per worker rather than once
+per file. A file that fails to load or render is reported without stopping the
+batch, and files that were in flight when a worker process died are retried in
+a new pool.
+
+The module is also available as a command line tool::
+
+    python -m pysmithchart render "data/*.s1p" -o charts --format png --jobs 8
+
+Functions:
+    render_files(paths, output_dir, ...):
+        Render one chart per file and return per-file results.
+
+    main(argv=None):
+        Command line entry point.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .constants import S_PARAMETER, Z_PARAMETER, Y_PARAMETER
+from .loaders import load_sweep
+from .template import SmithChartTemplate
+
+__all__ = ["render_files", "main"]
+
+_worker = None
+
+
+class _Worker:
+    """A reusable Smith chart template used to render many files."""
+
+    def __init__(self, style, figsize, dpi, datatype, cache):
+        self.template = SmithChartTemplate(figsize=figsize, dpi=dpi, **style)
+        self.datatype = datatype
+        self.cache = cache
+
+    def render(self, source, output):
+        """Plot the traces of `source` onto the template and save the chart to `output`."""
+        freq, data = load_sweep(source, cache=self.cache)
+        if data.ndim == 3:
+            traces = [data[:, i, i] for i in range(data.shape[1])]
+        elif data.ndim == 2:
+            traces = list(data.T)
+        else:
+            traces = [data]
+
+        try:
+            for trace in traces:
+                self.template.plot(np.asarray(trace), marker=None, datatype=self.datatype)
+        finally:
+            self.template.save(output, title=os.path.basename(source))
+        return len(freq)
+
+
+def _init_worker(style, figsize, dpi, datatype, cache):
+    """Create the figure that is reused for every file rendered by this process."""
+    global _worker  # pylint: disable=global-statement
+    _worker = _Worker(style, figsize, dpi, datatype, cache)
+
+
+def _render_one(source, output):
+    """Render a single file with the process-wide figure and return a result record."""
+    start = time.perf_counter()
+    record = {"source": source, "output": output, "points": 0, "error": None}
+    try:
+        record["points"] = _worker.render(source, output)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        record["error"] = "%s: %s" % (type(e).__name__, e)
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def render_files(
+    paths,
+    output_dir,
+    fmt="png",
+    style=None,
+    jobs=None,
+    figsize=(6, 6),
+    dpi=100,
+    datatype=S_PARAMETER,
+    cache=False,
+    retries=1,
+):
+    """
+    Render one Smith chart per measurement file.
+
+    Args:
+        paths (list[str]): CSV or Touchstone files, see `pysmithchart.loaders.load_sweep`.
+        output_dir (str): Directory for the charts, which are named after the source files.
+        fmt (str, optional): Output format passed to `savefig`. Defaults to "png".
+        style (dict, optional): scParams applied to every chart. Defaults to None.
+        jobs (int, optional): Number of worker processes. If 1, files are rendered in the
+            calling process. Defaults to the number of CPUs.
+        figsize (tuple, optional): Figure size in inches. Defaults to (6, 6).
+        dpi (float, optional): Figure resolution. Defaults to 100.
+        datatype (str, optional): Datatype of the traces. Defaults to `S_PARAMETER`.
+        cache (bool, optional): Use the binary sidecar cache of the loaders. Defaults to False.
+        retries (int, optional): How often a file is resubmitted after its worker process
+            died. Defaults to 1.
+
+    Returns:
+        list[dict]: One record per file with the keys `source`, `output`, `points`,
+        `seconds` and `error` (None on success), in the order of `paths`.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    initargs = (dict(style or {}), tuple(figsize), dpi, datatype, cache)
+    tasks = []
+    for path in paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        tasks.append((path, os.path.join(output_dir, "%s.%s" % (stem, fmt))))
+
+    results = {}
+    if jobs == 1:
+        _init_worker(*initargs)
+        for source, output in tasks:
+            results[source] = _render_one(source, output)
+        return [results[source] for source, _ in tasks]
+
+    attempts = dict.fromkeys(paths, 0)
+    pending = tasks
+    while pending:
+        retry = []
+        with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=initargs) as pool:
+            futures = {pool.submit(_render_one, *task): task for task in pending}
+            for future in as_completed(futures):
+                source, output = futures[future]
+                try:
+                    results[source] = future.result()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    attempts[source] += 1
+                    if attempts[source] <= retries:
+                        retry.append((source, output))
+                    else:
+                        results[source] = {
+                            "source": source,
+                            "output": output,
+                            "points": 0,
+                            "seconds": 0.0,
+                            "error": "%s: %s" % (type(e).__name__, e),
+                        }
+        pending = retry
+    return [results[source] for source, _ in tasks]
+
+
+def _parse_value(text):
+    """Interpret a command line parameter value as JSON, falling back to a string."""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def main(argv=None):
+    """
+    Command line entry point for ``python -m pysmithchart``.
+
+    Args:
+        argv (list[str], optional): Command line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: Exit status, 1 if any file failed to render.
+    """
+    parser = argparse.ArgumentParser(prog="python -m pysmithchart")
+    commands = parser.add_subparsers(dest="command", required=True)
+    render = commands.add_parser("render", help="render Smith charts from CSV or Touchstone files")
+    render.add_argument("patterns", nargs="+", help="glob patterns of input files")
+    render.add_argument("-o", "--output-dir", default=".", help="directory for the charts")
+    render.add_argument("-f", "--format", default="png", help="output format (png, svg, pdf, ...)")
+    render.add_argument("-j", "--jobs", type=int, default=None, help="number of worker processes")
+    render.add_argument("--style", help="JSON file with scParams")
+    render.add_argument(
+        "--set", action="append", default=[], metavar="KEY=VALUE", help="set a single scParam"
+    )
+    render.add_argument("--figsize", type=float, nargs=2, default=(6, 6), metavar=("W", "H"))
+    render.add_argument("--dpi", type=float, default=100)
+    render.add_argument("--datatype", choices=[S_PARAMETER, Z_PARAMETER, Y_PARAMETER], default=S_PARAMETER)
+    render.add_argument("--cache", action="store_true", help="use binary sidecar files")
+    render.add_argument("--report", help="write per-file timings to this JSON file")
+    render.add_argument("-q", "--quiet", action="store_true", help="only print the summary")
+    args = parser.parse_args(argv)
+
+    style = {}
+    if args.style:
+        with open(args.style, "r", encoding="utf-8") as f:
+            style.update(json.load(f))
+    for item in args.set:
+        key, _, value = item.partition("=")
+        style[key] = _parse_value(value)
+
+    paths = sorted({path for pattern in args.patterns for path in glob.glob(pattern)})
+    if not paths:
+        print("no input files match %s" % " ".join(args.patterns), file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    results = render_files(
+        paths,
+        args.output_dir,
+        fmt=args.format,
+        style=style,
+        jobs=args.jobs,
+        figsize=args.figsize,
+        dpi=args.dpi,
+        datatype=args.datatype,
+        cache=args.cache,
+    )
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if r["error"] is not None]
+    if not args.quiet:
+        for r in results:
+            status = "FAILED " + r["error"] if r["error"] else r["output"]
+            print("%8.3fs  %s -> %s" % (r["seconds"], r["source"], status))
+    print(
+        "%d charts, %d failed, %.2fs total, %.1f charts/s"
+        % (len(results), len(failed), elapsed, len(results) / elapsed if elapsed > 0 else 0.0)
+    )
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({"seconds": elapsed, "files": results}, f, indent=1)
+    return 1 if failed else 0
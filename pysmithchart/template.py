@@ -0,0 +1,153 @@
+"""
+This module contains reusable empty Smith chart templates.
+
+Most of the time needed to produce a single chart goes into building the empty
+`SmithAxes`: copying the parameters, computing locators and labels and
+constructing the grid. A `SmithChartTemplate` builds a fully configured empty
+chart once and then renders any number of datasets onto it. The data artists
+are removed again after each rendering, so every output only pays for drawing
+its own data.
+
+For PNG output the empty chart is rasterized once and the pixels are cached.
+Each dataset is then drawn directly on top of a copy of the cached background
+(blitting), so the grid, labels and spine are never redrawn. Other formats reuse
+the configured figure and go through a regular `savefig`.
+
+Example:
+    >>> from pysmithchart.template import SmithChartTemplate
+    >>> template = SmithChartTemplate(figsize=(6, 6), grid_minor_enable=True)
+    >>> for name, data in datasets.items():
+    ...     template.render(name + ".png", data, "b", datatype="S")
+    >>> template.plot(s11, datatype="S")
+    >>> template.plot(s22, datatype="S")
+    >>> template.save("both.svg", title="S11 and S22")
+"""
+
+import os
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.image import imsave
+
+__all__ = ["SmithChartTemplate"]
+
+
+class SmithChartTemplate:
+    """
+    An empty Smith chart that is built once and reused for many datasets.
+
+    Attributes:
+        figure (matplotlib.figure.Figure): The template figure.
+        axes (SmithAxes): The configured, empty Smith chart axes.
+    """
+
+    def __init__(self, figsize=(6, 6), dpi=100, **kwargs):
+        """
+        Build the empty chart.
+
+        Args:
+            figsize (tuple, optional): Figure size in inches. Defaults to (6, 6).
+            dpi (float, optional): Figure resolution. Defaults to 100.
+            **kwargs: Smith chart parameters and axes keyword arguments, as accepted by
+                `SmithAxes`.
+        """
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.axes = self.figure.add_subplot(1, 1, 1, projection="smith", **kwargs)
+        self._canvas = None
+        self._background = None
+        self._background_key = None
+        self._lines = []
+
+    def invalidate(self):
+        """Discard the cached raster background, e.g. after the template axes were modified."""
+        self._background = None
+        self._background_key = None
+
+    def plot(self, *args, **kwargs):
+        """
+        Plot data onto the template; it is removed again by the next `save`.
+
+        Args:
+            *args: Positional arguments passed to `SmithAxes.plot`.
+            **kwargs: Keyword arguments passed to `SmithAxes.plot`.
+
+        Returns:
+            list[matplotlib.lines.Line2D]: The plotted lines.
+        """
+        lines = self.axes.plot(*args, **kwargs)
+        self._lines += lines
+        return lines
+
+    def save(self, fname, fmt=None, title=None):
+        """
+        Save the chart with the data plotted since the last `save` and restore the empty chart.
+
+        Args:
+            fname (str or file-like): Output file name or binary file object.
+            fmt (str, optional): Output format. Defaults to the extension of `fname`, or
+                "png" for file objects.
+            title (str, optional): Axes title for this dataset. Defaults to None.
+        """
+        if fmt is None:
+            if isinstance(fname, (str, os.PathLike)):
+                fmt = os.path.splitext(os.fspath(fname))[1][1:].lower() or "png"
+            else:
+                fmt = "png"
+
+        lines, self._lines = self._lines, []
+        try:
+            if fmt == "png":
+                self._blit(fname, lines, title)
+            else:
+                self.axes.set_title(title or "")
+                self.figure.savefig(fname, format=fmt)
+        finally:
+            for line in lines:
+                line.remove()
+            self.axes.set_title("")
+            self.axes.set_prop_cycle(None)
+            self.axes._current_zorder = self.axes._get_key("plot.zorder")  # pylint: disable=protected-access
+
+    def render(self, fname, *args, fmt=None, title=None, **kwargs):
+        """
+        Plot a single dataset and save the chart, see `plot` and `save`.
+
+        Args:
+            fname (str or file-like): Output file name or binary file object.
+            *args: Positional arguments passed to `SmithAxes.plot`.
+            fmt (str, optional): Output format. Defaults to the extension of `fname`.
+            title (str, optional): Axes title for this dataset. Defaults to None.
+            **kwargs: Keyword arguments passed to `SmithAxes.plot`.
+        """
+        try:
+            self.plot(*args, **kwargs)
+        finally:
+            self.save(fname, fmt=fmt, title=title)
+
+    def _blit(self, fname, lines, title):
+        """Draw `lines` and `title` over the cached background and write a PNG file."""
+        if self._canvas is None or self.figure.canvas is not self._canvas:
+            self._canvas = FigureCanvasAgg(self.figure)
+            self.invalidate()
+
+        key = (tuple(self.figure.bbox.bounds), self.figure.dpi)
+        if self._background is None or key != self._background_key:
+            for line in lines:
+                line.set_visible(False)
+            self.axes.set_title("")
+            self._canvas.draw()
+            for line in lines:
+                line.set_visible(True)
+            self._background = self._canvas.copy_from_bbox(self.figure.bbox)
+            self._background_key = key
+        else:
+            self._canvas.restore_region(self._background)
+
+        renderer = self._canvas.get_renderer()
+        for line in sorted(lines, key=lambda artist: artist.get_zorder()):
+            line.draw(renderer)
+        if title:
+            self.axes.set_title(title)
+            self.axes.title.draw(renderer)
+        imsave(fname, np.asarray(self._canvas.buffer_rgba()), format="png", dpi=self.figure.dpi)
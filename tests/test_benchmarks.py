@@ -0,0 +1,43 @@
+"""
+Tests for the offline benchmark runner in `benchmarks.run`.
+
+Test Functions:
+    - test_parameters: Test the expansion of asv-style parameters.
+    - test_run_and_compare: Test running benchmarks quickly and comparing their results.
+"""
+
+import json
+
+from benchmarks import run
+from benchmarks.bench_grid import TimeGrid, TimeLocators
+
+
+def test_parameters():
+    """Test the expansion of asv-style parameters."""
+    assert run._parameters(TimeLocators) == [(10,), (40,)]
+    assert len(run._parameters(TimeGrid)) == len(TimeGrid.params[0]) * len(TimeGrid.params[1])
+    assert run._parameters(object) == [()]
+
+
+def test_run_and_compare(tmp_path, capsys):
+    """Test running benchmarks quickly and comparing their results."""
+    output = tmp_path / "results.json"
+    assert run.main(["run", "-q", "-b", "TimeLocators.time_real", "-o", str(output)]) == 0
+    results = json.loads(output.read_text())
+    assert set(results["results"]) == {
+        "bench_grid.TimeLocators.time_real(10)",
+        "bench_grid.TimeLocators.time_real(40)",
+    }
+    assert results["results"]["bench_grid.TimeLocators.time_real(10)"]["unit"] == "seconds"
+
+    slower = json.loads(output.read_text())
+    for record in slower["results"].values():
+        record["value"] *= 2
+    rows = run.compare(results, slower)
+    assert [mark for *_, mark in rows] == ["+", "+"]
+    assert all(abs(ratio - 2) < 1e-9 for *_, ratio, _ in rows)
+    other = tmp_path / "slower.json"
+    other.write_text(json.dumps(slower))
+    capsys.readouterr()
+    assert run.main(["compare", str(output), str(other)]) == 1
+    assert "time_real(40)" in capsys.readouterr().out
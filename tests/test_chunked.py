@@ -0,0 +1,69 @@
+"""
+Tests for out-of-core plotting with `ChunkedLine2D`.
+
+Test Functions:
+    - test_memmap_plot: Test that a memory-mapped array is plotted without copying.
+    - test_chunked_matches_plot: Test that the reduced line follows the ordinary line.
+    - test_chunked_invalid: Test the argument checks of the out-of-core mode.
+"""
+
+import io
+import os
+import numpy as np
+import pytest
+import matplotlib.pyplot as plt
+
+from pysmithchart import S_PARAMETER, Z_PARAMETER
+from pysmithchart.lines import ChunkedLine2D
+
+
+def spiral(n):
+    """Return n reflection coefficients on a slowly shrinking spiral."""
+    t = np.linspace(0, 40 * np.pi, n)
+    return (0.9 - 0.8 * t / t[-1]) * np.exp(1j * t)
+
+
+def test_memmap_plot(tmpdir):
+    """Test that a memory-mapped array is plotted without copying."""
+    path = os.path.join(str(tmpdir), "gamma.npy")
+    np.save(path, spiral(200000))
+    data = np.load(path, mmap_mode="r")
+
+    plt.figure(figsize=(4, 4))
+    ax = plt.subplot(1, 1, 1, projection="smith")
+    (line,) = ax.plot(data, "r-", datatype=S_PARAMETER, marker=None)
+    assert isinstance(line, ChunkedLine2D)
+    assert np.shares_memory(line.source, data)
+    assert line.get_color() == "r"
+
+    plt.savefig(io.BytesIO(), format="png")
+    x, _ = line.get_data()
+    assert 1 < len(x) < len(data) // 10
+    plt.close()
+
+
+def test_chunked_matches_plot():
+    """Test that the reduced line follows the ordinary line."""
+    z = 50 * (1 + spiral(5000)) / (1 - spiral(5000))
+
+    plt.figure(figsize=(4, 4))
+    ax = plt.subplot(1, 1, 1, projection="smith")
+    (line,) = ax.plot(z, datatype=Z_PARAMETER, chunksize=512, marker=None)
+    (full,) = ax.plot(z, datatype=Z_PARAMETER, marker=None)
+    plt.savefig(io.BytesIO(), format="png")
+
+    x, y = line.get_data()
+    fx, fy = full.get_data()
+    assert np.allclose([x[0], y[0], x[-1], y[-1]], [fx[0], fy[0], fx[-1], fy[-1]])
+    plt.close()
+
+
+def test_chunked_invalid():
+    """Test the argument checks of the out-of-core mode."""
+    plt.figure(figsize=(4, 4))
+    ax = plt.subplot(1, 1, 1, projection="smith")
+    with pytest.raises(ValueError):
+        ax.plot(np.ones(10), chunksize=4)
+    with pytest.raises(ValueError):
+        ax.plot(spiral(10), chunksize=4, interpolate=2)
+    plt.close()
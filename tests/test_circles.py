@@ -0,0 +1,127 @@
+"""
+Tests for circles in the reflection coefficient plane with `pysmithchart.circles`.
+
+Test Functions:
+    - test_circle_paths: Test that the paths are exact arcs clipped at the unit circle.
+    - test_stability_circles: Test that points on the stability circles have unit input and output reflection.
+    - test_gain_circles: Test that points on the gain circles have the requested gain.
+    - test_noise_circles: Test that points on the noise circles have the requested noise figure.
+    - test_axes_circle: Test drawing circles as a single collection.
+    - test_line_arcs: Test that line arcs follow the transformed loads.
+"""
+
+import io
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import PathCollection
+
+from pysmithchart import circles, network
+
+# S-parameters of a potentially unstable transistor at two frequencies
+S = np.array(
+    [
+        [[0.65 * np.exp(-2.4j), 0.035 * np.exp(0.4j)], [5.0 * np.exp(1.7j), 0.8 * np.exp(-0.5j)]],
+        [[0.6 * np.exp(-2.7j), 0.05 * np.exp(0.3j)], [3.2 * np.exp(1.4j), 0.7 * np.exp(-0.8j)]],
+    ]
+)
+ANGLES = np.exp(1j * np.linspace(0, 2 * np.pi, 7))
+
+
+def on_circle(center, radius):
+    """Points on the circles, with a trailing axis of points."""
+    return np.asarray(center)[..., None] + np.asarray(radius)[..., None] * ANGLES
+
+
+def test_circle_paths():
+    """Test that the paths are exact arcs clipped at the unit circle."""
+    center = np.array([0.2, 0.8 + 0.5j, 3, 0, np.nan])
+    radius = np.array([0.5, 0.6, 0.5, 2, 0.1])
+    paths = circles.circle_paths(center, radius)
+    assert [len(p.vertices) for p in paths] == [14, 13, 0, 0, 0]
+    for c, r, path in zip(center[:2], radius[:2], paths[:2]):
+        for t in np.linspace(0, 1, 5):
+            for k in range(4):
+                p = path.vertices[3 * k : 3 * k + 4]
+                b = (
+                    (1 - t) ** 3 * p[0]
+                    + 3 * (1 - t) ** 2 * t * p[1]
+                    + 3 * (1 - t) * t**2 * p[2]
+                    + t**3 * p[3]
+                )
+                assert abs(abs(complex(*b) - c) - r) < 1e-3 * r
+    ends = paths[1].vertices[[0, -1]]
+    assert np.allclose(np.hypot(ends[:, 0], ends[:, 1]), 1)
+
+
+def test_stability_circles():
+    """Test that points on the stability circles have unit input and output reflection."""
+    (cs, rs), (cl, rl) = circles.stability_circles(S)
+    assert cs.shape == rl.shape == (2,)
+    s11, s12, s21, s22 = S[:, 0, 0, None], S[:, 0, 1, None], S[:, 1, 0, None], S[:, 1, 1, None]
+    gl = on_circle(cl, rl)
+    assert np.allclose(np.abs(s11 + s12 * s21 * gl / (1 - s22 * gl)), 1)
+    gs = on_circle(cs, rs)
+    assert np.allclose(np.abs(s22 + s12 * s21 * gs / (1 - s11 * gs)), 1)
+
+
+def test_gain_circles():
+    """Test that points on the gain circles have the requested gain."""
+    s11, s12, s21, s22 = S[:, 0, 0, None], S[:, 0, 1, None], S[:, 1, 0, None], S[:, 1, 1, None]
+    gain_db = np.array([[12], [14]])
+    center, radius = circles.gain_circles(S[:, :, :], gain_db)
+    assert center.shape == (2, 2)
+    gl = on_circle(center, radius)
+    gin = s11 + s12 * s21 * gl / (1 - s22 * gl)
+    gp = np.abs(s21) ** 2 * (1 - np.abs(gl) ** 2) / ((1 - np.abs(gin) ** 2) * np.abs(1 - s22 * gl) ** 2)
+    assert np.allclose(10 * np.log10(gp), gain_db[..., None])
+
+    center, radius = circles.gain_circles(S, 12, plane="source")
+    gs = on_circle(center, radius)
+    gout = s22 + s12 * s21 * gs / (1 - s11 * gs)
+    ga = np.abs(s21) ** 2 * (1 - np.abs(gs) ** 2) / (np.abs(1 - s11 * gs) ** 2 * (1 - np.abs(gout) ** 2))
+    assert np.allclose(10 * np.log10(ga), 12)
+
+
+def test_noise_circles():
+    """Test that points on the noise circles have the requested noise figure."""
+    gamma_opt = 0.5 * np.exp(2j)
+    center, radius = circles.noise_circles([2, 3], 1.5, gamma_opt, rn=20, z0=50)
+    gs = on_circle(center, radius)
+    f = 10**0.15 + 4 * 0.4 * np.abs(gs - gamma_opt) ** 2 / (
+        (1 - np.abs(gs) ** 2) * np.abs(1 + gamma_opt) ** 2
+    )
+    assert np.allclose(10 * np.log10(f), [[2], [3]])
+    assert np.isnan(circles.noise_circles(1, 1.5, gamma_opt, rn=20)[1])
+
+
+def test_axes_circle():
+    """Test drawing circles as a single collection."""
+    plt.figure()
+    ax = plt.subplot(1, 1, 1, projection="smith")
+    collection = ax.circle(*circles.vswr_circles([1.5, 2, 3]), color="k", linestyle="--")
+    assert isinstance(collection, PathCollection)
+    assert len(collection.get_paths()) == 3
+    assert collection.get_transform() is ax.transMoebius
+    ax.circle([0.5 + 0.5j, 1.2], 0.6, color=["r", "b"])
+    plt.savefig(io.BytesIO(), format="svg")
+    plt.close()
+
+
+def test_line_arcs():
+    """Test that line arcs follow the transformed loads."""
+    plt.figure()
+    ax = plt.subplot(1, 1, 1, projection="smith")
+    loads = np.array([100 - 50j, 20 + 30j, 10 - 80j])
+    for z0, start, stop in [(50, 0, 0.15), (75, 0.1, 0.42), (30, 0.3, 0.1), (50, 0, 0.7)]:
+        collection = ax.line_arcs(loads, stop, start=start, z0=z0)
+        wavelengths = np.linspace(start, stop, 5) if abs(stop - start) < 0.5 else np.linspace(0, 0.5, 5)
+        _, expected = network.line_transform(loads[:, None], z0, wavelengths=wavelengths, reference=50)
+        for path, points in zip(collection.get_paths(), expected):
+            xy = np.concatenate([segment(np.linspace(0, 1, 500)) for segment, _ in path.iter_bezier()])
+            curve = xy[:, 0] + 1j * xy[:, 1]
+            assert max(np.min(np.abs(curve - point)) for point in points) < 1e-3
+            if abs(stop - start) < 0.5:
+                assert np.isclose(curve[0], points[0]) and np.isclose(curve[-1], points[-1])
+    assert len(ax.line_arcs(50, 0.2).get_paths()[0].vertices) == 0
+    plt.close()
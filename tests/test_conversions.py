@@ -0,0 +1,77 @@
+"""
+Tests for N-port parameter conversion with `pysmithchart.conversions`.
+
+Test Functions:
+    - test_round_trips: Test S, Z and Y round trips with complex per-port references.
+    - test_one_port: Test the one-port case against `utils.calc_gamma`.
+    - test_two_port_network: Test against the S-parameters of a cascaded two-port.
+    - test_renormalize: Test renormalization against conversion through Z-parameters.
+    - test_errors: Test invalid shapes.
+"""
+
+import numpy as np
+import pytest
+
+from pysmithchart import conversions, network, utils
+
+RNG = np.random.default_rng(1)
+
+
+def random_s(frequencies, ports):
+    """Return random S-parameters of shape (frequencies, ports, ports)."""
+    shape = (frequencies, ports, ports)
+    return 0.2 * (RNG.normal(size=shape) + 1j * RNG.normal(size=shape))
+
+
+@pytest.mark.parametrize("ports", [1, 2, 5])
+def test_round_trips(ports, monkeypatch):
+    """Test S, Z and Y round trips with complex per-port references."""
+    monkeypatch.setattr(conversions, "CONVERSION_CHUNKSIZE", 7)
+    s = random_s(20, ports)
+    z0 = RNG.uniform(20, 80, ports) + 1j * RNG.uniform(-20, 20, ports)
+    z = conversions.s2z(s, z0)
+    y = conversions.s2y(s, z0)
+    assert np.allclose(conversions.z2s(z, z0), s)
+    assert np.allclose(conversions.y2s(y, z0), s)
+    assert np.allclose(conversions.z2y(z), y)
+    assert np.allclose(conversions.y2z(y), z)
+    assert np.allclose(conversions.s2z(s[3], z0), z[3])
+
+
+def test_one_port():
+    """Test the one-port case against `utils.calc_gamma`."""
+    load = np.array([25 + 10j, 50, 100 - 75j])
+    s = conversions.z2s(load[:, None, None], 75)
+    assert np.allclose(s[:, 0, 0], utils.calc_gamma(75, load))
+    assert np.allclose(conversions.s2z(s, 75)[:, 0, 0], load)
+
+
+def test_two_port_network():
+    """Test against the S-parameters of a cascaded two-port."""
+    freq = np.linspace(1e9, 2e9, 11)
+    two_port = network.series_resistor(freq, 30) @ network.shunt_capacitor(freq, 2e-12)
+    s50 = two_port.s_parameters(50)
+    assert np.allclose(conversions.renormalize(s50, 75), two_port.s_parameters(75))
+    # a terminated two-port seen from port 1
+    z = conversions.s2z(s50)
+    zin = z[:, 0, 0] - z[:, 0, 1] * z[:, 1, 0] / (z[:, 1, 1] + 100)
+    assert np.allclose(zin, two_port.input_impedance(100))
+
+
+def test_renormalize():
+    """Test renormalization against conversion through Z-parameters."""
+    s = random_s(10, 3)
+    z_old = np.array([50, 75, 25 + 5j])
+    z_new = RNG.uniform(30, 60, (10, 3)) + 0j
+    s_new = conversions.renormalize(s, z_new, z_old)
+    assert np.allclose(s_new, conversions.z2s(conversions.s2z(s, z_old), z_new))
+    assert np.allclose(conversions.renormalize(s_new, z_old, z_new), s)
+    assert np.allclose(conversions.renormalize(s, 50), s)
+
+
+def test_errors():
+    """Test invalid shapes."""
+    with pytest.raises(ValueError):
+        conversions.s2z(np.zeros((4, 2, 3)))
+    with pytest.raises(ValueError):
+        conversions.s2z(np.zeros((4, 2, 2)), z0=[50, 50, 50])
@@ -0,0 +1,51 @@
+"""
+Tests for rational fitting with `pysmithchart.fitting`.
+
+Test Functions:
+    - test_exact_model: Test that a rational response is recovered exactly.
+    - test_network_resampling: Test dense evaluation of a fit to sparse samples of a two-port.
+    - test_errors: Test fits with too few samples.
+"""
+
+import numpy as np
+import pytest
+
+from pysmithchart import fitting, network
+
+FREQ = np.linspace(0.5e9, 3e9, 40)
+
+
+def test_exact_model():
+    """Test that a rational response is recovered exactly."""
+    poles = np.array([-1e9 + 8e9j, -1e9 - 8e9j, -3e9 + 1.5e10j, -3e9 - 1.5e10j])
+    residues = np.array([[2e9 + 1e9j, 2e9 - 1e9j, 5e8j, -5e8j], [1e9, 1e9, -2e9 + 3e9j, -2e9 - 3e9j]])
+    model = fitting.RationalFit(poles, residues, [0.1, -0.3], [0, 0])
+    fit = fitting.vector_fit(FREQ, model(FREQ), n_poles=4)
+    assert np.allclose(np.sort_complex(fit.poles), np.sort_complex(poles))
+    assert np.allclose(fit.constant, [0.1, -0.3])
+    assert fit.rms_error(FREQ, model(FREQ)).max() < 1e-10
+
+
+def test_network_resampling():
+    """Test dense evaluation of a fit to sparse samples of a two-port."""
+
+    def s_parameters(freq):
+        two_port = (
+            network.series_inductor(freq, 5e-9)
+            @ network.shunt_capacitor(freq, 2e-12)
+            @ network.transmission_line(freq, 0.03, z0=75)
+        )
+        return np.moveaxis(two_port.s_parameters(50), 0, -1)
+
+    fit = fitting.vector_fit(FREQ, s_parameters(FREQ), n_poles=10)
+    assert fit.residues.shape == (2, 2, 10)
+    assert (fit.poles.real < 0).all()
+    dense = np.linspace(FREQ[0], FREQ[-1], 1001)
+    assert fit(dense).shape == (2, 2, 1001)
+    assert np.allclose(fit(dense), s_parameters(dense), atol=1e-6)
+
+
+def test_errors():
+    """Test fits with too few samples."""
+    with pytest.raises(ValueError):
+        fitting.vector_fit(FREQ[:4], np.ones(4), n_poles=4)
@@ -0,0 +1,77 @@
+"""
+Tests for the grid construction of `SmithAxes`.
+
+Test Functions:
+    - test_grid_families: Test that each grid family is drawn as a single artist.
+    - test_gridline_path: Test that gridline arcs lie on the mapped grid circles.
+    - test_compact_svg: Test that the SVG output has one path element per grid family.
+    - test_shared_geometry: Test that identical subplots share their grid geometry.
+"""
+
+import io
+import numpy as np
+import matplotlib.pyplot as plt
+
+from pysmithchart.geometry import GEOMETRY_CACHE
+from pysmithchart.moebius_transform import gridline_path
+
+
+def test_grid_families():
+    """Test that each grid family is drawn as a single artist."""
+    plt.figure(figsize=(4, 4))
+    ax = plt.subplot(1, 1, 1, projection="smith", grid_minor_enable=True)
+    assert len(ax._gridlines["major"]) == 2
+    assert len(ax._gridlines["minor"]) == 2
+    assert len(ax._majorarcs) > 10
+    ax.grid(False, which="minor")
+    assert not ax._gridlines["minor"]
+    plt.close()
+
+
+def test_gridline_path():
+    """Test that gridline arcs lie on the mapped grid circles."""
+    plt.figure(figsize=(4, 4))
+    ax = plt.subplot(1, 1, 1, projection="smith")
+    path = gridline_path(ax, 1.0, -2.0, 5.0, "real")
+    start, end = path.vertices[0], path.vertices[-1]
+    assert np.allclose(start, [np.real(ax.moebius_z(1 - 2j)), np.imag(ax.moebius_z(1 - 2j))])
+    assert np.allclose(end, [np.real(ax.moebius_z(1 + 5j)), np.imag(ax.moebius_z(1 + 5j))])
+    on_curve = path.vertices[::3]
+    assert np.allclose(np.hypot(on_curve[:, 0] - 0.5, on_curve[:, 1]), 0.5)
+    plt.close()
+
+
+def test_compact_svg():
+    """Test that the SVG output has one path element per grid family."""
+    plt.figure(figsize=(4, 4))
+    plt.subplot(1, 1, 1, projection="smith", grid_minor_enable=True)
+    buffer = io.BytesIO()
+    plt.savefig(buffer, format="svg")
+    svg = buffer.getvalue().decode("utf-8")
+    assert svg.count("stroke-dasharray") == 2
+    assert svg.count('<g id="line2d_') == 0
+    plt.close()
+
+
+def test_shared_geometry():
+    """Test that identical subplots share their grid geometry."""
+    GEOMETRY_CACHE.clear()
+    fig = plt.figure(figsize=(6, 3))
+    ax1 = fig.add_subplot(1, 3, 1, projection="smith", grid_minor_enable=True)
+    misses = GEOMETRY_CACHE.stats()["misses"]
+    ax2 = fig.add_subplot(1, 3, 2, projection="smith", grid_minor_enable=True)
+    assert GEOMETRY_CACHE.stats()["misses"] == misses
+    for grid in ["major", "minor"]:
+        for p1, p2 in zip(ax1._gridlines[grid], ax2._gridlines[grid]):
+            assert p1.get_path() is p2.get_path()
+            assert p1 is not p2
+    assert ax1._majorarcs == ax2._majorarcs
+    assert not ax1.xaxis.get_major_locator()().flags.writeable
+
+    ax3 = fig.add_subplot(1, 3, 3, projection="smith", grid_minor_enable=True, grid_share=False)
+    assert GEOMETRY_CACHE.stats()["misses"] == misses
+    assert ax3._gridlines["major"][0].get_path() is not ax1._gridlines["major"][0].get_path()
+    np.testing.assert_allclose(
+        ax3._gridlines["major"][0].get_path().vertices, ax1._gridlines["major"][0].get_path().vertices
+    )
+    plt.close(fig)
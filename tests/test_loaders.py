@@ -0,0 +1,88 @@
+# pylint: disable=redefined-outer-name
+"""
+Tests for the sweep file loaders in `pysmithchart.loaders`.
+
+Test Functions:
+    - test_load_csv: Test parsing of the bundled CSV data.
+    - test_csv_sidecar: Test that a sidecar is written and memory-mapped on reload.
+    - test_stale_sidecar: Test that a changed source file invalidates the sidecar.
+    - test_prune_cache: Test removal of sidecars whose source has disappeared.
+    - test_load_touchstone: Test parsing of one- and two-port Touchstone files.
+"""
+
+import os
+import shutil
+import numpy as np
+import pytest
+
+from pysmithchart.loaders import load_csv, load_sweep, load_touchstone, prune_cache
+
+
+@pytest.fixture
+def s11_path(tmpdir):
+    """Copy the bundled S11 data to a temporary directory."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    path = os.path.join(str(tmpdir), "s11.csv")
+    shutil.copy(os.path.join(script_dir, "data", "s11.csv"), path)
+    return path
+
+
+def test_load_csv(s11_path):
+    """Test parsing of the bundled CSV data."""
+    freq, s11 = load_csv(s11_path)
+    table = np.loadtxt(s11_path, delimiter=",", skiprows=1)
+    assert np.array_equal(freq, table[:, 0])
+    assert np.array_equal(s11, table[:, 1] + 1j * table[:, 2])
+
+
+def test_csv_sidecar(s11_path, tmpdir):
+    """Test that a sidecar is written and memory-mapped on reload."""
+    cache_dir = os.path.join(str(tmpdir), "cache")
+    freq0, s110 = load_csv(s11_path, cache=True, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 2
+
+    freq1, s111 = load_sweep(s11_path, cache=True, cache_dir=cache_dir)
+    assert isinstance(freq1.base, np.memmap) or isinstance(freq1, np.memmap)
+    assert not s111.flags.writeable
+    assert np.array_equal(freq0, freq1)
+    assert np.array_equal(s110, s111)
+
+
+def test_stale_sidecar(s11_path):
+    """Test that a changed source file invalidates the sidecar."""
+    load_csv(s11_path, cache=True)
+    with open(s11_path, "w", encoding="utf-8") as f:
+        f.write("f,re,im\n1,0.5,0.25\n2,0.0,1.0\n")
+    freq, data = load_csv(s11_path, cache=True)
+    assert np.array_equal(freq, [1, 2])
+    assert np.array_equal(data, [0.5 + 0.25j, 1j])
+
+
+def test_prune_cache(s11_path, tmpdir):
+    """Test removal of sidecars whose source has disappeared."""
+    cache_dir = os.path.join(str(tmpdir), "cache")
+    load_csv(s11_path, cache=True, cache_dir=cache_dir)
+    assert not prune_cache(cache_dir)
+    os.remove(s11_path)
+    assert len(prune_cache(cache_dir)) == 2
+    assert not os.listdir(cache_dir)
+
+
+def test_load_touchstone(tmpdir):
+    """Test parsing of one- and two-port Touchstone files."""
+    path = os.path.join(str(tmpdir), "dut.s1p")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("! one port\n# MHz S RI R 50\n100 0.5 0.5\n200 0.0 -1.0 ! comment\n")
+    freq, s = load_touchstone(path, cache=True)
+    assert np.array_equal(freq, [100e6, 200e6])
+    assert np.allclose(s, [0.5 + 0.5j, -1j])
+
+    path = os.path.join(str(tmpdir), "dut.s2p")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# Hz S DB R 50\n1 0 0  -6.0206 90  -20 0  0 180\n")
+    freq, s = load_touchstone(path)
+    assert s.shape == (1, 2, 2)
+    assert np.allclose(s[0, 0, 0], 1)
+    assert np.allclose(s[0, 1, 0], 0.5j, atol=1e-5)
+    assert np.allclose(s[0, 0, 1], 0.1)
+    assert np.allclose(s[0, 1, 1], -1)
@@ -0,0 +1,78 @@
+"""
+Tests for matching network synthesis with `pysmithchart.matching`.
+
+Test Functions:
+    - test_l_network: Test that every valid L-section branch matches the load.
+    - test_stubs: Test single- and double-stub branches against cascaded networks.
+    - test_broadcasting: Test broadcasting of loads against reference impedances.
+    - test_path: Test the matching path and plotting it on a Smith chart.
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+import pytest
+
+from pysmithchart import S_PARAMETER, matching
+
+FREQ = np.linspace(1e9, 2e9, 6)
+LOAD = np.array([100 - 50j, 20 + 30j, 150, 50, 10 - 80j, 300 + 200j])
+
+
+def test_l_network():
+    """Test that every valid L-section branch matches the load."""
+    solutions = matching.l_network(LOAD, z0=50)
+    assert [s.topology for s in solutions] == ["shunt-series"] * 2 + ["series-shunt"] * 2
+    assert solutions[0].valid.all()
+    assert list(solutions[2].valid) == [False, True, False, True, True, False]
+    for solution in solutions:
+        zin = solution.network(FREQ).input_impedance(LOAD)
+        assert np.allclose(zin[solution.valid], 50)
+        assert np.isnan(zin[~solution.valid]).all()
+        assert np.allclose(solution.gamma[solution.valid, -1], 0)
+
+    series = solutions[0].components(FREQ)[1]
+    assert series["kind"] == "series"
+    assert (np.isfinite(series["inductance"]) != np.isfinite(series["capacitance"])).all()
+
+
+@pytest.mark.parametrize("stub", ["open", "short"])
+def test_stubs(stub):
+    """Test single- and double-stub branches against cascaded networks."""
+    for solution in matching.single_stub(LOAD, z0=50, stub=stub):
+        assert solution.valid.all()
+        kind, length = solution.elements[0]
+        assert kind == "line" and ((0 <= length) & (length < 0.5)).all()
+        assert np.allclose(solution.network(FREQ, velocity_factor=0.7).input_impedance(LOAD), 50)
+
+    load = np.append(LOAD[:-1], 10)
+    for solution in matching.double_stub(load, z0=50, spacing=0.125, stub=stub):
+        assert list(solution.valid) == [True, True, True, True, True, False]
+        zin = solution.network(FREQ).input_impedance(load)
+        assert np.allclose(zin[:5], 50)
+
+    with pytest.raises(ValueError):
+        matching.single_stub(LOAD, stub="load")
+
+
+def test_broadcasting():
+    """Test broadcasting of loads against reference impedances."""
+    z0 = np.array([[25], [50], [75]])
+    solutions = matching.l_network(LOAD, z0=z0)
+    assert solutions[0].valid.shape == (3, 6)
+    assert solutions[0].path(steps=4).shape == (3, 6, 9)
+    scalar = matching.single_stub(100 - 50j, z0=50)[0]
+    assert np.shape(scalar.elements[0][1]) == ()
+
+
+def test_path():
+    """Test the matching path and plotting it on a Smith chart."""
+    solution = matching.single_stub(LOAD, z0=50)[0]
+    path = solution.path(steps=16)
+    assert path.shape == (6, 33)
+    assert np.allclose(path[:, ::16], solution.gamma)
+    assert np.allclose(np.abs(path[:, :17]), np.abs(path[:, :1]))
+
+    plt.figure()
+    ax = plt.subplot(1, 1, 1, projection="smith")
+    ax.plot(path[0], datatype=S_PARAMETER, marker=None)
+    plt.close()
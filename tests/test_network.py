@@ -0,0 +1,89 @@
+"""
+Tests for two-port cascades with `pysmithchart.network`.
+
+Test Functions:
+    - test_quarter_wave_transformer: Test the impedance inversion of a quarter-wave line.
+    - test_lumped_elements: Test series resonance and an ideal transformer.
+    - test_s_parameters: Test the S-parameters of a matched line and of a shunt stub.
+    - test_cascade_errors: Test cascading networks with different frequencies.
+    - test_line_transform: Test load transformation along lines against cascaded networks.
+"""
+
+import numpy as np
+import pytest
+
+from pysmithchart import network
+
+F0 = 1e9
+QUARTER_WAVE = network.SPEED_OF_LIGHT / F0 / 4
+
+
+def test_quarter_wave_transformer():
+    """Test the impedance inversion of a quarter-wave line."""
+    freq = np.array([F0, 2 * F0])
+    line = network.transmission_line(freq, QUARTER_WAVE, z0=70.7)
+    zin = line.input_impedance(100)
+    assert np.isclose(zin[0], 70.7**2 / 100)
+    assert np.isclose(zin[1], 100)
+    assert np.isclose(line.s11(load=70.7**2 / 50)[0], 0)
+
+
+def test_lumped_elements():
+    """Test series resonance and an ideal transformer."""
+    freq = np.linspace(0.5e9, 1.5e9, 101)
+    inductance = 10e-9
+    capacitance = 1 / ((2 * np.pi * F0) ** 2 * inductance)
+    tank = network.series_inductor(freq, inductance) @ network.series_capacitor(freq, capacitance)
+    zin = tank.input_impedance(50)
+    assert np.isclose(zin[50], 50)
+    assert (zin[:50].imag < 0).all() and (zin[51:].imag > 0).all()
+
+    zin = network.cascade(network.transformer(freq, 2), network.shunt_resistor(freq, 100)).input_impedance()
+    assert np.allclose(zin, 400)
+
+
+def test_s_parameters():
+    """Test the S-parameters of a matched line and of a shunt stub."""
+    freq = np.linspace(0.5e9, 1.5e9, 11)
+    s = network.transmission_line(freq, 0.1, z0=50).s_parameters(50)
+    assert np.allclose(s[:, 0, 0], 0) and np.allclose(np.abs(s[:, 1, 0]), 1)
+
+    stub = network.shunt_stub(freq, QUARTER_WAVE, termination="short")
+    assert np.isclose(stub.s11()[5], 0)
+    assert np.allclose(stub.s_parameters()[:, 0, 0], stub.s11())
+    ref = np.matmul(stub.abcd, network.series_resistor(freq, 10).abcd)
+    assert np.allclose(network.cascade(stub, network.series_resistor(freq, 10)).abcd, ref)
+
+
+def test_cascade_errors():
+    """Test cascading networks with different frequencies."""
+    with pytest.raises(ValueError):
+        network.cascade(network.transformer([1e9], 2), network.transformer([2e9], 2))
+    with pytest.raises(ValueError):
+        network.cascade()
+    with pytest.raises(ValueError):
+        network.shunt_stub([1e9], 0.1, termination="load")
+
+
+def test_line_transform():
+    """Test load transformation along lines against cascaded networks."""
+    freq = np.linspace(0.5e9, 1.5e9, 11)
+    load = 30 - 40j
+    z, gamma = network.line_transform(load, 75, length=0.3, freq=freq, velocity_factor=0.7, loss=0.5)
+    line = network.transmission_line(freq, 0.3, z0=75, velocity_factor=0.7, loss=0.5)
+    assert np.allclose(z, line.input_impedance(load))
+    assert np.allclose(gamma, (z - 75) / (z + 75))
+
+    lengths = np.linspace(0, 1, 5)[:, None]
+    z, gamma = network.line_transform([load, np.inf], 50, length=lengths, freq=freq[:, None, None])
+    assert z.shape == (11, 5, 2)
+    assert np.allclose(np.abs(gamma[..., 0]), abs((load - 50) / (load + 50)))
+    wavelengths = lengths[:, 0] * freq[:, None] / network.SPEED_OF_LIGHT
+    assert np.allclose(gamma[..., 1], np.exp(-4j * np.pi * wavelengths))
+
+    z, _ = network.line_transform(load, 50, wavelengths=[0.25, 0.5])
+    assert np.allclose(z, [50**2 / load, load])
+    with pytest.raises(ValueError):
+        network.line_transform(load, 50, wavelengths=0.1, loss=1)
+    with pytest.raises(ValueError):
+        network.line_transform(load, 50, length=0.1)
@@ -0,0 +1,82 @@
+"""
+Tests for the opt-in instrumentation in `pysmithchart.perf`.
+
+Test Functions:
+    - test_disabled: Test that nothing is recorded while the instrumentation is disabled.
+    - test_axes_stats: Test per-axes and global timings and counters of a rendered chart.
+    - test_chrome_trace: Test the Chrome trace export.
+"""
+
+import io
+import json
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from pysmithchart import perf
+from pysmithchart.geometry import GEOMETRY_CACHE
+
+
+def render(**kwargs):
+    """Create, plot and render a chart and return its axes."""
+    fig = plt.figure(figsize=(4, 4))
+    ax = fig.add_subplot(1, 1, 1, projection="smith", **kwargs)
+    ax.plot(np.linspace(10, 200, 100) + 30j, datatype="Z")
+    fig.savefig(io.BytesIO(), format="png")
+    plt.close(fig)
+    return ax
+
+
+def test_disabled():
+    """Test that nothing is recorded while the instrumentation is disabled."""
+    perf.reset()
+    assert not perf.is_enabled()
+    ax = render()
+    assert perf.timer("grid") is perf.timer("draw")
+    assert perf.stats() == {"timings": {}, "counters": {}}
+    assert ax.perf_stats() == {"timings": {}, "counters": {}}
+
+
+def test_axes_stats():
+    """Test per-axes and global timings and counters of a rendered chart."""
+    perf.reset()
+    GEOMETRY_CACHE.clear()
+    with perf.profile():
+        first = render(grid_minor_enable=True)
+        second = render(grid_minor_enable=True)
+    assert not perf.is_enabled()
+
+    stats = first.perf_stats()
+    assert {"grid", "locator", "labels", "transform", "draw"} <= set(stats["timings"])
+    assert stats["timings"]["draw"]["calls"] == 1
+    assert stats["counters"]["draws"] == 1
+    assert stats["counters"]["grid.arcs"] > 0
+    assert stats["counters"]["geometry.misses"] > 0
+    assert stats["counters"]["transform.points"] > 100
+    # the second chart reuses the geometry of the first one
+    assert "grid.arcs" not in second.perf_stats()["counters"]
+    assert second.perf_stats()["counters"]["geometry.hits"] > 0
+
+    total = perf.stats()
+    assert total["counters"]["draws"] == 2
+    assert total["timings"]["draw"]["total"] >= stats["timings"]["draw"]["total"]
+    first.perf_stats(reset=True)
+    assert first.perf_stats() == {"timings": {}, "counters": {}}
+    assert perf.stats()["counters"]["draws"] == 2
+
+
+def test_chrome_trace():
+    """Test the Chrome trace export."""
+    perf.reset()
+    with perf.profile():
+        ax = render()
+        with perf.timer("user", ax):
+            perf.count("items", 3)
+    buffer = io.StringIO()
+    perf.export_chrome_trace(buffer, ax)
+    events = json.loads(buffer.getvalue())["traceEvents"]
+    spans = [e for e in events if e["ph"] == "X"]
+    assert {"draw", "user"} <= {e["name"] for e in spans}
+    assert all(e["dur"] >= 0 and e["args"]["axes"].startswith("SmithAxes@") for e in spans)
+    counters = {e["name"]: e["args"][e["name"]] for e in events if e["ph"] == "C"}
+    assert counters["items"] == 3
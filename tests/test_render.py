@@ -0,0 +1,49 @@
+"""
+Tests for batch rendering with `pysmithchart.render`.
+
+Test Functions:
+    - test_render_inline: Test rendering in the calling process with a reused figure.
+    - test_render_pool: Test rendering through a process pool with a failing file.
+    - test_main: Test the command line entry point.
+"""
+
+import json
+import os
+
+from pysmithchart.render import main, render_files
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SOURCES = [os.path.join(DATA_DIR, "s11.csv"), os.path.join(DATA_DIR, "s22.csv")]
+
+
+def test_render_inline(tmpdir):
+    """Test rendering in the calling process with a reused figure."""
+    results = render_files(SOURCES, str(tmpdir), fmt="png", jobs=1, dpi=50)
+    assert [r["error"] for r in results] == [None, None]
+    for r in results:
+        assert os.path.getsize(r["output"]) > 0
+        assert r["points"] > 0
+
+
+def test_render_pool(tmpdir):
+    """Test rendering through a process pool with a failing file."""
+    missing = os.path.join(str(tmpdir), "missing.csv")
+    results = render_files(SOURCES + [missing], str(tmpdir), fmt="svg", jobs=2, dpi=50)
+    assert [r["source"] for r in results] == SOURCES + [missing]
+    assert results[0]["error"] is None and results[1]["error"] is None
+    assert results[2]["error"].startswith("FileNotFoundError")
+
+
+def test_main(tmpdir, capsys):
+    """Test the command line entry point."""
+    style = os.path.join(str(tmpdir), "style.json")
+    with open(style, "w", encoding="utf-8") as f:
+        json.dump({"grid.major.color": "b"}, f)
+    report = os.path.join(str(tmpdir), "report.json")
+    argv = ["render", os.path.join(DATA_DIR, "s1*.csv"), "-o", str(tmpdir), "-j", "1"]
+    argv += ["--style", style, "--set", "grid.minor.enable=true", "--report", report, "--dpi", "50"]
+    assert main(argv) == 0
+    assert "1 charts, 0 failed" in capsys.readouterr().out
+    with open(report, "r", encoding="utf-8") as f:
+        assert len(json.load(f)["files"]) == 1
+    assert os.path.exists(os.path.join(str(tmpdir), "s11.png"))
@@ -0,0 +1,47 @@
+"""
+Tests for reusable chart templates in `pysmithchart.template`.
+
+Test Functions:
+    - test_blit_matches_savefig: Test that the cached raster path matches a full redraw.
+    - test_template_is_reset: Test that the template is empty again after each save.
+"""
+
+import io
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.image import imread
+
+from pysmithchart import S_PARAMETER
+from pysmithchart.template import SmithChartTemplate
+
+GAMMA = 0.5 * np.exp(1j * np.linspace(0, 3, 20))
+
+
+def test_blit_matches_savefig():
+    """Test that the cached raster path matches a full redraw."""
+    template = SmithChartTemplate(figsize=(4, 4), dpi=50)
+    template.render(io.BytesIO(), GAMMA * 0.1, "g", datatype=S_PARAMETER)
+    blitted = io.BytesIO()
+    template.render(blitted, GAMMA, "r", datatype=S_PARAMETER)
+
+    template.axes.plot(GAMMA, "r", datatype=S_PARAMETER)
+    full = io.BytesIO()
+    template.figure.savefig(full, format="png")
+
+    blitted.seek(0)
+    full.seek(0)
+    a, b = imread(blitted), imread(full)
+    assert a.shape == b.shape
+    assert np.mean(np.abs(a - b)) < 0.01
+
+
+def test_template_is_reset():
+    """Test that the template is empty again after each save."""
+    template = SmithChartTemplate(figsize=(4, 4), dpi=50)
+    n_children = len(template.axes.get_children())
+    template.plot(GAMMA, datatype=S_PARAMETER)
+    template.plot(2 * GAMMA, datatype=S_PARAMETER)
+    template.save(io.BytesIO(), fmt="svg", title="two traces")
+    assert len(template.axes.get_children()) == n_children
+    assert template.axes.get_title() == ""
+    plt.close("all")
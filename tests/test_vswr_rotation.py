@@ -0,0 +1,83 @@
+"""
+Unit tests for the `vswr_rotation` function in `pysmithchart.utils`.
+
+Functions:
+    - test_scalar_destinations: Test rotation of a single point to each kind of destination.
+    - test_unreachable_scalar: Ensure unreachable scalar destinations raise a `ValueError`.
+    - test_zero_reactance: Test rotation onto the real axis.
+    - test_broadcasting: Test broadcasting of points against destinations with masked entries.
+    - test_invalid_arguments: Ensure error handling for invalid arguments.
+"""
+
+import numpy as np
+import pytest
+
+from pysmithchart.utils import vswr_rotation
+
+
+def gamma(z, impedance=50):
+    """Reflection coefficient of `z`."""
+    return (z - impedance) / (z + impedance)
+
+
+def test_scalar_destinations():
+    """Test rotation of a single point to each kind of destination."""
+    z0, z1, lmb = vswr_rotation(20, 30, impedance=50, real=50)
+    assert z0 == 20 + 30j
+    assert np.isclose(z1.real, 50) and z1.imag < 0
+    assert np.isclose(abs(gamma(z1)), abs(gamma(z0)))
+    assert -0.5 < lmb < 0
+
+    _, z1, _ = vswr_rotation(20, 30, impedance=50, real=50, solution2=False)
+    assert np.isclose(z1.real, 50) and z1.imag > 0
+
+    _, z1, lmb = vswr_rotation(20, 30, impedance=50, imag=-60, direction="ccw")
+    assert np.isclose(z1.imag, -60)
+    assert 0 < lmb < 0.5
+
+    _, z1, lmb = vswr_rotation(20, 30, impedance=50, lambda_rotation=0.25)
+    assert np.isclose(gamma(z1), -gamma(20 + 30j)) and np.isclose(lmb, -0.25)
+
+
+def test_unreachable_scalar():
+    """Ensure unreachable scalar destinations raise a `ValueError`."""
+    with pytest.raises(ValueError):
+        vswr_rotation(20, 30, impedance=50, real=200)
+    with pytest.raises(ValueError):
+        vswr_rotation(50, 0, impedance=50, imag=10)
+
+
+def test_zero_reactance():
+    """Test rotation onto the real axis."""
+    _, z1, _ = vswr_rotation(20, 30, impedance=50, imag=0)
+    _, z2, _ = vswr_rotation(20, 30, impedance=50, imag=0, solution2=False)
+    assert np.isclose(z1.imag, 0) and np.isclose(z2.imag, 0)
+    assert np.isclose(z1.real * z2.real, 50**2)
+
+
+def test_broadcasting():
+    """Test broadcasting of points against destinations with masked entries."""
+    x = np.array([20, 100, 10])
+    y = np.array([30, -40, 5])
+    real = np.array([[50], [200]])
+    z0, z1, lmb = vswr_rotation(x, y, impedance=50, real=real)
+    assert z0.shape == z1.shape == lmb.shape == (2, 3)
+    assert np.allclose(z0, x + 1j * y)
+    assert np.allclose(z1[0].real, 50)
+    assert np.isnan(z1[1, :2]).all() and np.isnan(lmb[1, :2]).all()
+    assert np.isclose(z1[1, 2].real, 200)
+    for i, k in np.ndindex(2, 3):
+        if not np.isnan(lmb[i, k]):
+            _, z, rot = vswr_rotation(x[k], y[k], impedance=50, real=real[i, 0])
+            assert np.isclose(z, z1[i, k]) and np.isclose(rot, lmb[i, k])
+
+    _, z1, _ = vswr_rotation(x, y, impedance=50, imag=[10, 0, -20])
+    assert np.allclose(z1.imag, [10, 0, -20])
+
+
+def test_invalid_arguments():
+    """Ensure error handling for invalid arguments."""
+    with pytest.raises(ValueError):
+        vswr_rotation(20, 30, real=1, imag=1)
+    with pytest.raises(ValueError):
+        vswr_rotation(20, 30, direction="up")